@@ -2,14 +2,20 @@
 DevTools Helper - A comprehensive developer productivity toolkit for Python projects.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Kartikeya Kotkar"
 __email__ = "null"
 
-from .code_checker import CodeChecker
-from .config_manager import ConfigManager
-from .dev_server import DevServer
-from .project_generator import ProjectGenerator
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, or just the CLI, does not pull in every backend and its dependencies.
+_LAZY_IMPORTS = {
+    "ProjectGenerator": "project_generator",
+    "CodeChecker": "code_checker",
+    "ConfigManager": "config_manager",
+    "DevServer": "dev_server",
+}
 
 __all__ = [
     "ProjectGenerator",
@@ -17,3 +23,19 @@ __all__ = [
     "ConfigManager",
     "DevServer",
 ]
+
+
+def __getattr__(name):
+    """Import public classes from their submodules on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir() output."""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -0,0 +1,8 @@
+"""
+Entry point for ``python -m devtools_helper``.
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,164 @@
 Command-line interface for DevTools Helper.
 """
 
+import functools
+import os
 import sys
-from pathlib import Path
 from typing import Optional
 
 import click
 
-from .code_checker import CodeChecker
-from .config_manager import ConfigManager
-from .dev_server import DevServer, ProjectRunner
-from .project_generator import ProjectGenerator
+from . import __version__
+
+_TEMPLATE_CHOICES = ("basic", "webapp", "cli", "data-science", "package")
+_CONFIG_CHOICES = ("basic", "web", "api", "ml")
+_FORMAT_CHOICES = ("yaml", "json", "toml")
+_SEVERITY_CHOICES = ("info", "warning", "error")
+_WATCH_MODE_CHOICES = ("auto", "native", "poll")
+
+_BOOL_TRUE = frozenset({"true", "yes", "1", "on"})
+
+# Converters for `devtools config --type`, keyed by type name
+_VALUE_COERCIONS = {
+    "string": str,
+    "int": int,
+    "float": float,
+    "bool": lambda value: value.lower() in _BOOL_TRUE,
+}
+
+_TEMPLATE_DESCRIPTIONS = {
+    "basic": "Basic Python package structure",
+    "webapp": "Flask/FastAPI web application",
+    "cli": "Command-line application",
+    "data-science": "Data science project with notebooks",
+    "package": "Python package structure",
+}
+
+# The built-in templates are fixed, so `devtools templates` output is too
+_TEMPLATES_LISTING = "\n".join(
+    ["Available project templates:", "=" * 35]
+    + [
+        f"  {template:<15} - {description}"
+        for template, description in _TEMPLATE_DESCRIPTIONS.items()
+    ]
+    + ["", "Usage: devtools create-project my-project --template <template>"]
+)
+
+# Directories that never hold project sources; pruned when walking a project
+_PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "site-packages",
+        "dist",
+        "build",
+    }
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_project_type(path: str) -> str:
+    """Detect the project type of a resolved path, at most once per process."""
+    from .dev_server import ProjectRunner
+
+    return ProjectRunner.detect_project_type(path)
+
+
+def _count_python_files(root: str) -> int:
+    """Count .py files under root without descending into vendored dirs."""
+    count = 0
+    for _, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _PRUNE_DIRS]
+        count += sum(1 for name in filenames if name.endswith(".py"))
+    return count
+
+
+def _list_entry_names(path: str) -> set:
+    """Return the names in a directory with one scan, or nothing for files."""
+    if not os.path.isdir(path):
+        return set()
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+def _cache_dir() -> str:
+    """Return the per-user cache directory for devtools_helper."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "devtools_helper")
+
+
+def _template_cache_file(config_type: str, format: str) -> str:
+    """Return the cache location of a rendered init-config template."""
+    return os.path.join(
+        _cache_dir(), "templates", _template_cache_key(), f"{config_type}.{format}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _template_cache_key() -> str:
+    """Identify the installed code that renders init-config templates."""
+    import hashlib
+
+    # Keyed on content rather than mtime: installers such as wheels can
+    # leave an upgraded config_manager.py older than the cached templates
+    source = os.path.join(os.path.dirname(__file__), "config_manager.py")
+    try:
+        with open(source, "rb") as f:
+            return f"{__version__}-{hashlib.sha256(f.read()).hexdigest()[:16]}"
+    except OSError:
+        # e.g. imported from a zip archive
+        return __version__
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Return the orjson module if it is installed, otherwise None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dump_json(data) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    orjson = _orjson()
+    if orjson is None:
+        import json
+
+        return json.dumps(data, indent=2)
+
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _write_json(data, output: str) -> None:
+    """Write data as indented JSON to output, using orjson when installed."""
+    orjson = _orjson()
+    if orjson is None:
+        import json
+
+        # Stream from the encoder into the file instead of building the
+        # whole document in memory first; json.dump emits many small chunks,
+        # so give it a larger buffer than the 8 KiB default
+        with open(output, "w", encoding="utf-8", buffering=1 << 16) as file:
+            json.dump(data, file, indent=2)
+        return
+
+    # orjson already produces UTF-8 bytes; skip the decode/encode round-trip
+    with open(output, "wb") as file:
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 @click.group()
-@click.version_option(version="0.1.0", prog_name="devtools")
+@click.version_option(__version__, "--version", "-V", prog_name="devtools")
 def cli():
     """DevTools Helper - A comprehensive developer productivity toolkit."""
 
@@ -26,19 +170,21 @@ def cli():
     "--template",
     "-t",
     default="basic",
-    type=click.Choice(["basic", "webapp", "cli", "data-science", "package"]),
+    type=click.Choice(_TEMPLATE_CHOICES),
     help="Project template to use",
 )
 @click.option("--output", "-o", default=".", help="Output directory")
 def create_project(name: str, template: str, output: str):
     """Create a new project from a template."""
+    from .project_generator import ProjectGenerator
+
     try:
         generator = ProjectGenerator()
         success = generator.create_project(name, template, output)
 
         if success:
             click.echo(f"Project '{name}' created successfully.")
-            click.echo(f"Location: {Path(output) / name}")
+            click.echo(f"Location: {os.path.normpath(os.path.join(output, name))}")
 
             click.echo("\nNext steps:")
             click.echo(f"  cd {name}")
@@ -68,27 +214,35 @@ def create_project(name: str, template: str, output: str):
     help="Output format",
 )
 @click.option("--output", "-o", help="Save report to file")
-def check_quality(path: str, format: str, output: Optional[str]):
+@click.option(
+    "--cache/--no-cache", default=True, help="Reuse results for unchanged files"
+)
+@click.option(
+    "--severity",
+    type=click.Choice(_SEVERITY_CHOICES),
+    default="info",
+    help="Minimum severity to report",
+)
+def check_quality(
+    path: str, format: str, output: Optional[str], cache: bool, severity: str
+):
     """Check code quality and generate reports."""
+    from .code_checker import CodeChecker
+
     try:
-        checker = CodeChecker()
+        cache_path = os.path.join(_cache_dir(), "analysis.pickle") if cache else None
+        checker = CodeChecker(cache_path=cache_path, min_severity=severity)
         click.echo(f"Analyzing code quality in: {path}")
 
         report = checker.analyze(path)
 
         if format == "console":
             checker.print_report(report)
+        elif output:
+            _write_json(report, output)
+            click.echo(f"Report saved to: {output}")
         else:
-            import json
-
-            json_report = json.dumps(report, indent=2)
-
-            if output:
-                with open(output, "w", encoding="utf-8") as file:
-                    file.write(json_report)
-                click.echo(f"Report saved to: {output}")
-            else:
-                click.echo(json_report)
+            click.echo(_dump_json(report))
 
         if report["summary"]["errors"] > 0:
             sys.exit(1)
@@ -104,29 +258,53 @@ def check_quality(path: str, format: str, output: Optional[str]):
     "-t",
     "config_type",
     default="basic",
-    type=click.Choice(["basic", "web", "api", "ml"]),
+    type=click.Choice(_CONFIG_CHOICES),
     help="Configuration template type",
 )
 @click.option(
     "--format",
     "-f",
     default="yaml",
-    type=click.Choice(["yaml", "json", "toml"]),
+    type=click.Choice(_FORMAT_CHOICES),
     help="Configuration file format",
 )
 @click.option("--output", "-o", help="Output file path")
 def init_config(config_type: str, format: str, output: Optional[str]):
     """Initialize configuration file from template."""
-    try:
-        config = ConfigManager()
-        config.create_template(config_type)
+    import shutil
+    from pathlib import Path
 
+    try:
         if not output:
             output = f"config.{format}"
 
-        config.config_path = Path(output)
-        config.format = format
-        config.save()
+        cached = _template_cache_file(config_type, format)
+
+        if os.path.isfile(cached):
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output)
+        else:
+            from .config_manager import ConfigManager
+
+            config = ConfigManager()
+            config.create_template(config_type)
+            config.config_path = Path(output)
+            config.format = format
+            config.save()
+
+            # Copy to a per-process temporary name and rename it into place,
+            # so a concurrent init-config never copies a half-written template
+            tmp_path = f"{cached}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                shutil.copyfile(output, tmp_path)
+                os.replace(tmp_path, cached)
+            except OSError:
+                # The cache is an optimisation only; never fail the command
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
         click.echo(f"Configuration file created: {output}")
         click.echo(f"Template type: {config_type}")
@@ -149,6 +327,12 @@ def init_config(config_type: str, format: str, output: Optional[str]):
 @click.option("--static-dir", "-s", help="Static files directory")
 @click.option("--command", "-c", help="Custom command to run")
 @click.option("--watch", "-w", multiple=True, help="Additional directories to watch")
+@click.option(
+    "--watch-mode",
+    type=click.Choice(_WATCH_MODE_CHOICES),
+    default="auto",
+    help="File watching backend (auto polls network filesystems)",
+)
 def serve(
     port: int,
     host: str,
@@ -156,11 +340,16 @@ def serve(
     static_dir: Optional[str],
     command: Optional[str],
     watch: tuple,
+    watch_mode: str,
 ):
     """Start development server with hot reload."""
+    import signal
+
+    from .dev_server import DevServer, ProjectRunner
+
     try:
         if not command and not static_dir:
-            project_type = ProjectRunner.detect_project_type()
+            project_type = _detect_project_type(os.path.abspath("."))
             command = ProjectRunner.get_run_command(project_type)
 
             if not command:
@@ -176,9 +365,24 @@ def serve(
             watch_dirs=watch_dirs,
             command=command,
             static_dir=static_dir,
+            watch_mode=watch_mode,
         )
 
+        def _interrupt(signum, frame):
+            # Only unwind here; start() stops the server once, on the main flow
+            raise KeyboardInterrupt
+
+        # Treat SIGTERM like Ctrl-C so process supervisors stop the server
+        # through the same cleanup path
+        try:
+            signal.signal(signal.SIGTERM, _interrupt)
+        except (OSError, ValueError):
+            # Not in the main thread or unsupported on this platform
+            pass
+
         server.start()
+        # start() only returns after an interrupt has stopped the server
+        click.echo("Server stopped by user.")
 
     except KeyboardInterrupt:
         click.echo("Server stopped by user.")
@@ -195,12 +399,14 @@ def serve(
 @click.option(
     "--type",
     "-t",
-    type=click.Choice(["string", "int", "float", "bool"]),
+    type=click.Choice(tuple(_VALUE_COERCIONS)),
     default="string",
     help="Value type",
 )
 def config(config_file: str, key: str, value: Optional[str], delete: bool, type: str):
     """Manage configuration values."""
+    from .config_manager import ConfigManager
+
     try:
         manager = ConfigManager(config_file)
 
@@ -213,12 +419,7 @@ def config(config_file: str, key: str, value: Optional[str], delete: bool, type:
                 sys.exit(1)
 
         elif value is not None:
-            if type == "int":
-                value = int(value)
-            elif type == "float":
-                value = float(value)
-            elif type == "bool":
-                value = value.lower() in ("true", "yes", "1", "on")
+            value = _VALUE_COERCIONS[type](value)
 
             manager.set(key, value)
             manager.save()
@@ -240,54 +441,36 @@ def config(config_file: str, key: str, value: Optional[str], delete: bool, type:
 @cli.command()
 def templates():
     """List available project templates."""
-    try:
-        generator = ProjectGenerator()
-        available_templates = generator.list_templates()
-
-        click.echo("Available project templates:")
-        click.echo("=" * 35)
-
-        descriptions = {
-            "basic": "Basic Python package structure",
-            "webapp": "Flask/FastAPI web application",
-            "cli": "Command-line application",
-            "data-science": "Data science project with notebooks",
-            "package": "Python package structure",
-        }
-
-        for template in available_templates:
-            description = descriptions.get(template, "No description")
-            click.echo(f"  {template:<15} - {description}")
-
-        click.echo(
-            "\nUsage: devtools create-project my-project --template <template>"
-        )
-
-    except Exception as exc:
-        click.echo(f"Error listing templates: {exc}", err=True)
-        sys.exit(1)
+    click.echo(_TEMPLATES_LISTING)
 
 
 @cli.command()
 @click.argument("path", default=".")
 def info(path: str):
     """Show project information and suggestions."""
-    try:
-        path_obj = Path(path)
+    from concurrent.futures import ThreadPoolExecutor
 
-        if not path_obj.exists():
+    try:
+        if not os.path.exists(path):
             click.echo(f"Path does not exist: {path}")
             sys.exit(1)
 
-        click.echo(f"Project information: {path_obj.resolve()}")
-        click.echo("=" * 50)
+        resolved = os.path.realpath(path)
+        lines = [f"Project information: {resolved}", "=" * 50]
+
+        # The probes are independent and I/O-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            type_future = executor.submit(_detect_project_type, resolved)
+            count_future = executor.submit(_count_python_files, path)
+            present_future = executor.submit(_list_entry_names, path)
 
-        project_type = ProjectRunner.detect_project_type(path)
-        click.echo(f"Project type: {project_type}")
+        project_type = type_future.result()
+        python_file_count = count_future.result()
+        present = present_future.result()
 
-        python_files = list(path_obj.rglob("*.py"))
-        if python_files:
-            click.echo(f"Python files: {len(python_files)}")
+        lines.append(f"Project type: {project_type}")
+        if python_file_count:
+            lines.append(f"Python files: {python_file_count}")
 
         common_files = [
             "requirements.txt",
@@ -298,28 +481,30 @@ def info(path: str):
             "Dockerfile",
         ]
 
-        found = [f for f in common_files if (path_obj / f).exists()]
+        found = [f for f in common_files if f in present]
         if found:
-            click.echo(f"Found: {', '.join(found)}")
+            lines.append(f"Found: {', '.join(found)}")
 
         suggestions = []
 
-        if python_files and not (path_obj / "requirements.txt").exists():
+        if python_file_count and "requirements.txt" not in present:
             suggestions.append("Create requirements.txt")
-        if not (path_obj / "README.md").exists():
+        if "README.md" not in present:
             suggestions.append("Add README.md")
-        if not (path_obj / ".gitignore").exists():
+        if ".gitignore" not in present:
             suggestions.append("Add .gitignore")
 
         if suggestions:
-            click.echo("\nSuggestions:")
-            for suggestion in suggestions:
-                click.echo(f"  - {suggestion}")
+            lines.append("\nSuggestions:")
+            lines.extend(f"  - {suggestion}" for suggestion in suggestions)
 
-        click.echo("\nAvailable commands:")
-        click.echo(f"  devtools check-quality {path}")
-        click.echo("  devtools serve --port 8000")
-        click.echo("  devtools init-config --type web")
+        lines.append("\nAvailable commands:")
+        lines.append(f"  devtools check-quality {path}")
+        lines.append("  devtools serve --port 8000")
+        lines.append("  devtools init-config --type web")
+
+        # Emit the whole report with a single write
+        click.echo("\n".join(lines))
 
     except Exception as exc:
         click.echo(f"Error getting project info: {exc}", err=True)
@@ -328,6 +513,11 @@ def info(path: str):
 
 def main():
     """Main entry point for the CLI."""
+    # Answer --version without building a click context for the group
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        click.echo(f"devtools, version {__version__}")
+        return
+
     cli()
 
 
@@ -3,17 +3,73 @@ Code quality checker for analyzing Python code and providing quality reports.
 """
 
 import ast
+import functools
+import hashlib
+import itertools
+import os
+import pickle
 import re
+import stat
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Below this many files, process pool start-up costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Upper bound on the number of files remembered by the result cache
+_CACHE_MAX_ENTRIES = 20000
+
+_SNAKE_CASE_RE = re.compile(r"[a-z_][a-z0-9_]*\Z")
+_PASCAL_CASE_RE = re.compile(r"[A-Z][a-zA-Z0-9]*\Z")
+
+# Directory names that are never analyzed
+_SKIP_PARTS = frozenset(
+    (
+        "__pycache__",
+        ".git",
+        "venv",
+        "env",
+        ".venv",
+        "node_modules",
+        ".pytest_cache",
+    )
+)
+
+# Severities from least to most severe
+_SEVERITY_RANK = {"info": 0, "warning": 1, "error": 2}
+
+# Per-file metrics that are summed across files
+_COUNT_METRICS = ("total_files", "total_lines", "total_functions", "total_classes")
 
 
 class CodeChecker:
     """Analyzes Python code quality and provides detailed reports."""
 
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, min_severity: str = "info"):
+        """
+        Initialize the code checker.
+
+        Args:
+            cache_path: File used to cache per-file results between runs;
+                results are not cached when omitted
+            min_severity: Least severe issue level to report ("info",
+                "warning" or "error")
+        """
+        if min_severity not in _SEVERITY_RANK:
+            raise ValueError(
+                f"Unknown severity '{min_severity}'. Choose from: {list(_SEVERITY_RANK)}"
+            )
+
+        self.min_severity = min_severity
         self.issues = []
         self.metrics = {}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache = self._load_cache()
+        self._cache_dirty = False
 
     def analyze(self, path: str) -> Dict[str, Any]:
         """
@@ -27,10 +83,43 @@ class CodeChecker:
         """
         path_obj = Path(path)
 
-        if not path_obj.exists():
-            raise FileNotFoundError(f"Path '{path}' does not exist")
+        # One stat answers both "does it exist" and "is it a file"
+        try:
+            mode = os.stat(path_obj).st_mode
+        except (OSError, ValueError):
+            raise FileNotFoundError(f"Path '{path}' does not exist") from None
+
+        self._reset()
 
+        if stat.S_ISREG(mode):
+            if path_obj.suffix == ".py":
+                self._analyze_files([path_obj])
+        else:
+            self._analyze_directory(path_obj)
+
+        self._save_cache()
+        return self._generate_report()
+
+    def analyze_sources(self, sources: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        Analyze in-memory Python sources, such as unsaved editor buffers.
+
+        Args:
+            sources: Mapping of file name to source code; the names are only
+                used to label issues and are never opened
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        self._reset()
+        for file_str, source in sources.items():
+            self._analyze_source(file_str, source)
+        return self._generate_report()
+
+    def _reset(self):
+        """Clear results from any previous analysis."""
         self.issues = []
+        self._missing_docstrings = 0
         self.metrics = {
             "total_files": 0,
             "total_lines": 0,
@@ -41,172 +130,207 @@ class CodeChecker:
             "maintainability_score": 0,
         }
 
-        if path_obj.is_file():
-            if path_obj.suffix == ".py":
-                self._analyze_file(path_obj)
-        else:
-            self._analyze_directory(path_obj)
-
-        return self._generate_report()
-
     def _analyze_directory(self, directory: Path):
         """Analyze all Python files in a directory."""
-        python_files = list(directory.rglob("*.py"))
-
-        for file_path in python_files:
-            if not self._should_skip_file(file_path):
-                self._analyze_file(file_path)
+        self._analyze_files(list(_iter_python_files(str(directory))))
+
+    def _analyze_files(self, python_files: List[Union[str, Path]]):
+        """Analyze files, reusing cached results for unchanged ones."""
+        results = [None] * len(python_files)
+        pending = []
+
+        for index, file_path in enumerate(python_files):
+            key, stamp = self._cache_key(file_path)
+            cached = self._cache.get(key)
+            if cached is not None and stamp is not None:
+                if cached[0] != stamp:
+                    # A fresh checkout or a touched file changes the stamp
+                    # but not the content, so fall back to comparing digests
+                    if cached[1] is None or _file_digest(file_path) != cached[1]:
+                        cached = None
+                    else:
+                        self._cache[key] = cached = (stamp, cached[1], cached[2])
+                        self._cache_dirty = True
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[index] = cached[2]
+                    continue
+            pending.append((index, file_path, key, stamp))
+
+        computed = self._run_files([file_path for _, file_path, _, _ in pending])
+        for (index, _, key, stamp), (result, digest) in zip(pending, computed):
+            results[index] = result
+            if self.cache_path and stamp is not None:
+                self._cache[key] = (stamp, digest, result)
+                self._cache_dirty = True
+
+        for issues, counts in results:
+            # The cache keeps its own issue dicts; reports get copies so that
+            # editing a report cannot change later runs or the saved cache
+            self.issues.extend(map(dict, issues))
+            for metric in _COUNT_METRICS:
+                self.metrics[metric] += counts[metric]
+            self._missing_docstrings += counts["missing_docstrings"]
+
+    def _run_files(self, python_files: List[Union[str, Path]]) -> list:
+        """Analyze files from scratch, in parallel when worthwhile."""
+        # Source digests are only needed to validate cache entries
+        digest = self.cache_path is not None
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(python_files) < _PARALLEL_MIN_FILES:
+            return [
+                _analyze_file_worker(str(file_path), self.min_severity, digest)
+                for file_path in python_files
+            ]
+
+        # Files are independent and parsing is CPU-bound, so spread them
+        # across processes and merge the results in the caller
+        chunksize = max(1, len(python_files) // (workers * 4))
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(
+                    executor.map(
+                        _analyze_file_worker,
+                        map(str, python_files),
+                        itertools.repeat(self.min_severity),
+                        itertools.repeat(digest),
+                        chunksize=chunksize,
+                    )
+                )
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool on this platform; analyze serially
+            return [
+                _analyze_file_worker(str(file_path), self.min_severity, digest)
+                for file_path in python_files
+            ]
+
+    def _cache_key(self, file_path: Union[str, Path]) -> Tuple[tuple, Optional[tuple]]:
+        """Return the cache key and (mtime, size) stamp for a file."""
+        # Issues embed the path as given, so it is part of the key, and which
+        # issues are collected depends on the severity threshold
+        file_str = str(file_path)
+        key = (os.path.abspath(file_str), file_str, self.min_severity)
+        if not self.cache_path:
+            return key, None
+        try:
+            stat = os.stat(file_str)
+        except OSError:
+            return key, None
+        return key, (stat.st_mtime_ns, stat.st_size)
+
+    def _load_cache(self) -> "OrderedDict":
+        """Load cached per-file results written by a previous run."""
+        if not self.cache_path:
+            return OrderedDict()
+        try:
+            with open(self.cache_path, "rb") as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return OrderedDict()
+        # Results computed by a different version of the checker are stale
+        if version != _cache_version():
+            return OrderedDict()
+        return entries
+
+    def _save_cache(self):
+        """Persist cached per-file results, keeping the most recent entries."""
+        if not self.cache_path or not self._cache_dirty:
+            return
+
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
-    def _analyze_file(self, file_path: Path):
-        """Analyze a single Python file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((_cache_version(), self._cache), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except OSError:
+            # The cache is an optimisation only; never fail the analysis
+            pass
+
+    def _analyze_file(self, file_path: Path) -> Optional[bytes]:
+        """Analyze a single Python file and return its source, if readable."""
+        file_str = str(file_path)
+        try:
+            # ast.parse decodes bytes itself (honouring coding cookies), so the
+            # source is never decoded to a str up front
+            with open(file_path, "rb") as f:
+                source = f.read()
+        except Exception as e:
+            self._record_parse_failure(file_str, e)
+            return None
+        self._analyze_source(file_str, source)
+        return source
 
+    def _analyze_source(self, file_str: str, source: Union[str, bytes]):
+        """Analyze the source of one Python file, reported under file_str."""
+        try:
             # Parse AST
-            tree = ast.parse(content, filename=str(file_path))
+            tree = ast.parse(source, filename=file_str)
 
             # Update metrics
+            lines = source.splitlines()
             self.metrics["total_files"] += 1
-            self.metrics["total_lines"] += len(content.splitlines())
+            self.metrics["total_lines"] += len(lines)
 
-            # Analyze the AST
-            analyzer = ASTAnalyzer(file_path)
+            # Run every AST-based check in a single traversal
+            analyzer = ASTAnalyzer(Path(file_str), self.min_severity)
             analyzer.visit(tree)
 
             # Collect results
             self.issues.extend(analyzer.issues)
             self.metrics["total_functions"] += analyzer.function_count
             self.metrics["total_classes"] += analyzer.class_count
+            self._missing_docstrings += analyzer.missing_docstrings
 
-            # Check specific quality aspects
-            self._check_line_length(content, file_path)
-            self._check_imports(tree, file_path)
-            self._check_naming_conventions(tree, file_path)
-            self._check_documentation(tree, file_path)
+            if _SEVERITY_RANK[self.min_severity] <= _SEVERITY_RANK["warning"]:
+                self._check_line_length(lines, file_str)
 
         except Exception as e:
-            self.issues.append(
-                {
-                    "type": "syntax_error",
-                    "file": str(file_path),
-                    "line": 0,
-                    "message": f"Failed to parse file: {str(e)}",
-                    "severity": "error",
-                }
-            )
+            self._record_parse_failure(file_str, e)
+
+    def _record_parse_failure(self, file_str: str, error: Exception):
+        """Report a file that could not be read or parsed."""
+        self.issues.append(
+            {
+                "type": "syntax_error",
+                "file": file_str,
+                "line": 0,
+                "message": f"Failed to parse file: {str(error)}",
+                "severity": "error",
+            }
+        )
 
-    def _check_line_length(self, content: str, file_path: Path):
+    def _check_line_length(self, lines: List[Union[str, bytes]], file_str: str):
+        """Report lines longer than the maximum line length."""
         max_length = 88
-        lines = content.splitlines()
 
-        for i, line in enumerate(lines, 1):
-            if len(line) > max_length:
+        # A line never has more characters than bytes, so most files are
+        # cleared by one C-level pass without decoding anything
+        if not lines or max(map(len, lines)) <= max_length:
+            return
+
+        for i, raw_line in enumerate(lines, 1):
+            if len(raw_line) <= max_length:
+                continue
+            length = (
+                len(raw_line)
+                if isinstance(raw_line, str)
+                else len(raw_line.decode("utf-8", "replace"))
+            )
+            if length > max_length:
                 self.issues.append(
                     {
                         "type": "line_too_long",
-                        "file": str(file_path),
+                        "file": file_str,
                         "line": i,
-                        "message": f"Line too long ({len(line)} > {max_length} characters)",
-                        "severity": "warning",
-                    }
-                )
-
-    def _check_imports(self, tree: ast.AST, file_path: Path):
-        """Check import organization and unused imports."""
-        imports = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                imports.append(
-                    {
-                        "line": node.lineno,
-                        "type": type(node).__name__,
-                        "module": getattr(node, "module", None),
-                        "names": [alias.name for alias in node.names],
-                    }
-                )
-
-        # Check if imports are at the top
-        first_import_line = min([imp["line"] for imp in imports]) if imports else 0
-
-        for node in ast.walk(tree):
-            if (
-                isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Assign))
-                and hasattr(node, "lineno")
-                and node.lineno < first_import_line
-            ):
-                self.issues.append(
-                    {
-                        "type": "import_not_at_top",
-                        "file": str(file_path),
-                        "line": first_import_line,
-                        "message": "Imports should be at the top of the file",
+                        "message": f"Line too long ({length} > {max_length} characters)",
                         "severity": "warning",
                     }
                 )
-                break
-
-    def _check_naming_conventions(self, tree: ast.AST, file_path: Path):
-        """Check Python naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not re.match(r"^[a-z_][a-z0-9_]*$", node.name):
-                    self.issues.append(
-                        {
-                            "type": "naming_convention",
-                            "file": str(file_path),
-                            "line": node.lineno,
-                            "message": f"Function name '{node.name}' should be snake_case",
-                            "severity": "info",
-                        }
-                    )
-
-            elif isinstance(node, ast.ClassDef):
-                if not re.match(r"^[A-Z][a-zA-Z0-9]*$", node.name):
-                    self.issues.append(
-                        {
-                            "type": "naming_convention",
-                            "file": str(file_path),
-                            "line": node.lineno,
-                            "message": f"Class name '{node.name}' should be PascalCase",
-                            "severity": "info",
-                        }
-                    )
-
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                if node.id.isupper() and len(node.id) > 1 and "_" not in node.id:
-                    # Constant should have underscores
-                    pass
-
-    def _check_documentation(self, tree: ast.AST, file_path: Path):
-        """Check for documentation strings."""
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                if not ast.get_docstring(node):
-                    self.issues.append(
-                        {
-                            "type": "missing_docstring",
-                            "file": str(file_path),
-                            "line": node.lineno,
-                            "message": f"{type(node).__name__} '{node.name}' is missing a docstring",
-                            "severity": "info",
-                        }
-                    )
-
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if file should be skipped from analysis."""
-        skip_patterns = [
-            "__pycache__",
-            ".git",
-            "venv",
-            "env",
-            ".venv",
-            "node_modules",
-            ".pytest_cache",
-        ]
-
-        return any(pattern in str(file_path) for pattern in skip_patterns)
 
     def _calculate_complexity_score(self) -> float:
         """Calculate overall complexity score."""
@@ -227,12 +351,8 @@ class CodeChecker:
         else:
             return 40.0
 
-    def _calculate_documentation_score(self) -> float:
+    def _calculate_documentation_score(self, missing_docstrings: int) -> float:
         """Calculate documentation score."""
-        missing_docstrings = len(
-            [issue for issue in self.issues if issue["type"] == "missing_docstring"]
-        )
-
         total_documentable = (
             self.metrics["total_functions"] + self.metrics["total_classes"]
         )
@@ -243,41 +363,50 @@ class CodeChecker:
         documented = total_documentable - missing_docstrings
         return (documented / total_documentable) * 100
 
-    def _calculate_maintainability_score(self) -> float:
+    def _calculate_maintainability_score(
+        self, severity_counts: Dict[str, int]
+    ) -> float:
         """Calculate overall maintainability score."""
-        error_count = len([i for i in self.issues if i["severity"] == "error"])
-        warning_count = len([i for i in self.issues if i["severity"] == "warning"])
-
         # Base score
         score = 100.0
 
         # Deduct for issues
-        score -= error_count * 20
-        score -= warning_count * 5
+        score -= severity_counts["error"] * 20
+        score -= severity_counts["warning"] * 5
 
         return max(0.0, score)
 
     def _generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive analysis report."""
-        # Calculate scores
-        self.metrics["complexity_score"] = self._calculate_complexity_score()
-        self.metrics["documentation_score"] = self._calculate_documentation_score()
-        self.metrics["maintainability_score"] = self._calculate_maintainability_score()
-
-        # Group issues by type
+        # Group issues by type and count severities in a single pass
         issues_by_type = {}
+        severity_counts = {"error": 0, "warning": 0, "info": 0}
         for issue in self.issues:
             issue_type = issue["type"]
             if issue_type not in issues_by_type:
                 issues_by_type[issue_type] = []
             issues_by_type[issue_type].append(issue)
 
+            severity = issue["severity"]
+            if severity in severity_counts:
+                severity_counts[severity] += 1
+
+        # Calculate scores
+        self.metrics["complexity_score"] = self._calculate_complexity_score()
+        # Missing docstrings are counted even when info issues are not reported
+        self.metrics["documentation_score"] = self._calculate_documentation_score(
+            self._missing_docstrings
+        )
+        self.metrics["maintainability_score"] = self._calculate_maintainability_score(
+            severity_counts
+        )
+
         # Generate summary
         summary = {
             "total_issues": len(self.issues),
-            "errors": len([i for i in self.issues if i["severity"] == "error"]),
-            "warnings": len([i for i in self.issues if i["severity"] == "warning"]),
-            "info": len([i for i in self.issues if i["severity"] == "info"]),
+            "errors": severity_counts["error"],
+            "warnings": severity_counts["warning"],
+            "info": severity_counts["info"],
         }
 
         return {
@@ -285,10 +414,12 @@ class CodeChecker:
             "metrics": self.metrics,
             "issues": self.issues,
             "issues_by_type": issues_by_type,
-            "recommendations": self._get_recommendations(),
+            "recommendations": self._get_recommendations(issues_by_type),
         }
 
-    def _get_recommendations(self) -> List[str]:
+    def _get_recommendations(
+        self, issues_by_type: Dict[str, List[Dict[str, Any]]]
+    ) -> List[str]:
         """Get recommendations based on analysis."""
         recommendations = []
 
@@ -302,14 +433,12 @@ class CodeChecker:
                 "Address code quality issues to improve maintainability"
             )
 
-        line_length_issues = [i for i in self.issues if i["type"] == "line_too_long"]
-        if len(line_length_issues) > 5:
+        if len(issues_by_type.get("line_too_long", ())) > 5:
             recommendations.append(
                 "Consider using a code formatter like Black to fix line length issues"
             )
 
-        naming_issues = [i for i in self.issues if i["type"] == "naming_convention"]
-        if len(naming_issues) > 3:
+        if len(issues_by_type.get("naming_convention", ())) > 3:
             recommendations.append(
                 "Follow Python naming conventions (snake_case for functions, PascalCase for classes)"
             )
@@ -318,106 +447,272 @@ class CodeChecker:
 
     def print_report(self, report: Dict[str, Any]):
         """Print a formatted report to console."""
-        print("🔍 Code Quality Analysis Report")
-        print("=" * 40)
+        # Build the whole report first and write it in one call
+        lines = ["Code Quality Analysis Report", "=" * 40]
 
         # Summary
         summary = report["summary"]
-        print(f"\n📊 Summary:")
-        print(f"   Total Issues: {summary['total_issues']}")
-        print(f"   Errors: {summary['errors']}")
-        print(f"   Warnings: {summary['warnings']}")
-        print(f"   Info: {summary['info']}")
+        lines += [
+            "\nSummary:",
+            f"   Total Issues: {summary['total_issues']}",
+            f"   Errors: {summary['errors']}",
+            f"   Warnings: {summary['warnings']}",
+            f"   Info: {summary['info']}",
+        ]
 
         # Metrics
         metrics = report["metrics"]
-        print(f"\n📈 Metrics:")
-        print(f"   Files Analyzed: {metrics['total_files']}")
-        print(f"   Total Lines: {metrics['total_lines']}")
-        print(f"   Functions: {metrics['total_functions']}")
-        print(f"   Classes: {metrics['total_classes']}")
+        lines += [
+            "\nMetrics:",
+            f"   Files Analyzed: {metrics['total_files']}",
+            f"   Total Lines: {metrics['total_lines']}",
+            f"   Functions: {metrics['total_functions']}",
+            f"   Classes: {metrics['total_classes']}",
+        ]
 
         # Scores
-        print(f"\n🎯 Scores:")
-        print(f"   Complexity: {metrics['complexity_score']:.1f}/100")
-        print(f"   Documentation: {metrics['documentation_score']:.1f}/100")
-        print(f"   Maintainability: {metrics['maintainability_score']:.1f}/100")
+        lines += [
+            "\nScores:",
+            f"   Complexity: {metrics['complexity_score']:.1f}/100",
+            f"   Documentation: {metrics['documentation_score']:.1f}/100",
+            f"   Maintainability: {metrics['maintainability_score']:.1f}/100",
+        ]
 
         # Top issues
         if report["issues"]:
-            print(f"\n⚠️  Top Issues:")
+            lines.append("\nTop Issues:")
+            severity_icon = {"error": "[E]", "warning": "[W]", "info": "[I]"}
             for issue in report["issues"][:5]:
-                severity_icon = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}
-                icon = severity_icon.get(issue["severity"], "•")
-                print(f"   {icon} {issue['file']}:{issue['line']} - {issue['message']}")
+                icon = severity_icon.get(issue["severity"], "-")
+                lines.append(
+                    f"   {icon} {issue['file']}:{issue['line']} - {issue['message']}"
+                )
 
         # Recommendations
         if report["recommendations"]:
-            print(f"\n💡 Recommendations:")
-            for rec in report["recommendations"]:
-                print(f"   • {rec}")
+            lines.append("\nRecommendations:")
+            lines.extend(f"   - {rec}" for rec in report["recommendations"])
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _analyze_file_worker(
+    file_path: str, min_severity: str = "info", digest: bool = False
+) -> Tuple[Tuple[List[Dict[str, Any]], Dict[str, int]], Optional[bytes]]:
+    """Analyze one file from scratch.
+
+    Returns its issues and counters, plus the digest of the analyzed source
+    when digest is true (None otherwise, or if the file could not be read).
+    """
+    checker = CodeChecker(min_severity=min_severity)
+    checker._reset()
+    source = checker._analyze_file(Path(file_path))
+    counts = {metric: checker.metrics[metric] for metric in _COUNT_METRICS}
+    counts["missing_docstrings"] = checker._missing_docstrings
+    if not digest or source is None:
+        return (checker.issues, counts), None
+    return (checker.issues, counts), hashlib.sha256(source).digest()
+
+
+def _file_digest(file_path: Union[str, Path]) -> Optional[bytes]:
+    """Return the SHA-256 digest of a file's content, or None if unreadable."""
+    try:
+        with open(file_path, "rb") as f:
+            # file_digest (Python 3.11+) hashes straight from the file
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").digest()
+            return hashlib.sha256(f.read()).digest()
+    except OSError:
+        return None
+
+
+def _iter_python_files(root: str) -> Iterator[str]:
+    """Yield Python files under root in the order Path.rglob would."""
+    # Skipped directories are pruned before descending into them, and only
+    # components below root are checked, so analyzing a project inside e.g.
+    # ~/env still works
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        prefix = "" if directory == "." else directory
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name not in _SKIP_PARTS and not entry.is_symlink():
+                            subdirs.append(os.path.join(prefix, entry.name))
+                    elif entry.name.endswith(".py"):
+                        yield os.path.join(prefix, entry.name)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+# Fields that hold statement lists (or handlers/match cases wrapping them)
+_STATEMENT_FIELDS = frozenset(("body", "orelse", "finalbody", "handlers", "cases"))
+
+# Node types that can hold statement lists; match_case is new in Python 3.10
+_STATEMENT_PARENTS = (ast.mod, ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, "match_case") else ()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _statement_fields(node_type: type) -> Tuple[str, ...]:
+    """Return the statement-list fields of an AST node type, in field order."""
+    # Expression nodes such as IfExp and Lambda also have body/orelse fields
+    if not issubclass(node_type, _STATEMENT_PARENTS):
+        return ()
+    return tuple(field for field in node_type._fields if field in _STATEMENT_FIELDS)
+
+
+def _has_docstring(node) -> bool:
+    """Check for a non-blank docstring without cleaning it like ast.get_docstring."""
+    body = node.body
+    if not body or not isinstance(body[0], ast.Expr):
+        return False
+    value = body[0].value
+    return (
+        isinstance(value, ast.Constant)
+        and isinstance(value.value, str)
+        and not value.value.isspace()
+        and value.value != ""
+    )
+
+
+def _cache_version() -> tuple:
+    """Identify the checker code that produced cached results."""
+    stat = os.stat(__file__)
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 class ASTAnalyzer(ast.NodeVisitor):
-    """AST visitor for analyzing Python code structure."""
+    """AST visitor that runs all structural, naming and documentation checks."""
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, min_severity: str = "info"):
         self.file_path = file_path
+        self._file_str = str(file_path)
         self.issues = []
         self.function_count = 0
         self.class_count = 0
         self.complexity = 0
+        self.missing_docstrings = 0
+        self.first_import_line = None
+        self.first_definition_line = None
+
+        # Checks whose issues would be filtered out are skipped entirely
+        min_rank = _SEVERITY_RANK[min_severity]
+        self._report_warnings = min_rank <= _SEVERITY_RANK["warning"]
+        self._report_info = min_rank <= _SEVERITY_RANK["info"]
+
+    def generic_visit(self, node):
+        """Visit only nested statements; expressions cannot hold anything checked."""
+        for field in _statement_fields(type(node)):
+            for child in getattr(node, field):
+                self.visit(child)
+
+    def visit_Module(self, node):
+        """Visit the module, then check import placement."""
+        self.generic_visit(node)
+
+        # Imports should come before any function, class or assignment
+        if (
+            self._report_warnings
+            and self.first_import_line is not None
+            and self.first_definition_line is not None
+            and self.first_definition_line < self.first_import_line
+        ):
+            self._emit(
+                "import_not_at_top",
+                self.first_import_line,
+                "Imports should be at the top of the file",
+                "warning",
+            )
+
+    def visit_Import(self, node):
+        """Record the first import line."""
+        self._record_import(node)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        """Record the first import line."""
+        self._record_import(node)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        """Record the first definition line."""
+        self._record_definition(node)
+        self.generic_visit(node)
 
     def visit_FunctionDef(self, node):
         """Visit function definitions."""
         self.function_count += 1
+        self._record_definition(node)
+
+        if self._report_warnings:
+            # Check function length
+            if node.end_lineno:
+                func_length = node.end_lineno - node.lineno
+                if func_length > 50:
+                    self._emit(
+                        "function_too_long",
+                        node.lineno,
+                        f"Function '{node.name}' is too long ({func_length} lines)",
+                        "warning",
+                    )
 
-        # Check function length
-        if hasattr(node, "end_lineno") and node.end_lineno:
-            func_length = node.end_lineno - node.lineno
-            if func_length > 50:
-                self.issues.append(
-                    {
-                        "type": "function_too_long",
-                        "file": str(self.file_path),
-                        "line": node.lineno,
-                        "message": f"Function '{node.name}' is too long ({func_length} lines)",
-                        "severity": "warning",
-                    }
+            # Check parameter count
+            if len(node.args.args) > 5:
+                self._emit(
+                    "too_many_parameters",
+                    node.lineno,
+                    f"Function '{node.name}' has too many parameters ({len(node.args.args)})",
+                    "warning",
                 )
 
-        # Check parameter count
-        if len(node.args.args) > 5:
-            self.issues.append(
-                {
-                    "type": "too_many_parameters",
-                    "file": str(self.file_path),
-                    "line": node.lineno,
-                    "message": f"Function '{node.name}' has too many parameters ({len(node.args.args)})",
-                    "severity": "warning",
-                }
+        # Check naming convention
+        if self._report_info and not _SNAKE_CASE_RE.match(node.name):
+            self._emit(
+                "naming_convention",
+                node.lineno,
+                f"Function name '{node.name}' should be snake_case",
+                "info",
             )
 
+        self._check_docstring(node)
         self.generic_visit(node)
 
     def visit_ClassDef(self, node):
         """Visit class definitions."""
         self.class_count += 1
+        self._record_definition(node)
 
         # Check class length
-        if hasattr(node, "end_lineno") and node.end_lineno:
+        if self._report_warnings and node.end_lineno:
             class_length = node.end_lineno - node.lineno
             if class_length > 200:
-                self.issues.append(
-                    {
-                        "type": "class_too_long",
-                        "file": str(self.file_path),
-                        "line": node.lineno,
-                        "message": f"Class '{node.name}' is too long ({class_length} lines)",
-                        "severity": "warning",
-                    }
+                self._emit(
+                    "class_too_long",
+                    node.lineno,
+                    f"Class '{node.name}' is too long ({class_length} lines)",
+                    "warning",
                 )
 
+        # Check naming convention
+        if self._report_info and not _PASCAL_CASE_RE.match(node.name):
+            self._emit(
+                "naming_convention",
+                node.lineno,
+                f"Class name '{node.name}' should be PascalCase",
+                "info",
+            )
+
+        self._check_docstring(node)
         self.generic_visit(node)
 
     def visit_If(self, node):
@@ -434,3 +729,39 @@ class ASTAnalyzer(ast.NodeVisitor):
         """Visit while loops for complexity."""
         self.complexity += 1
         self.generic_visit(node)
+
+    def _check_docstring(self, node):
+        """Count, and report, functions and classes without a docstring."""
+        if not _has_docstring(node):
+            # Counted regardless of severity filtering for the documentation score
+            self.missing_docstrings += 1
+            if self._report_info:
+                self._emit(
+                    "missing_docstring",
+                    node.lineno,
+                    f"{type(node).__name__} '{node.name}' is missing a docstring",
+                    "info",
+                )
+
+    def _emit(self, issue_type: str, line: int, message: str, severity: str):
+        """Record an issue found in the analyzed file."""
+        self.issues.append(
+            {
+                "type": issue_type,
+                "file": self._file_str,
+                "line": line,
+                "message": message,
+                "severity": severity,
+            }
+        )
+
+    def _record_import(self, node):
+        if self.first_import_line is None or node.lineno < self.first_import_line:
+            self.first_import_line = node.lineno
+
+    def _record_definition(self, node):
+        if (
+            self.first_definition_line is None
+            or node.lineno < self.first_definition_line
+        ):
+            self.first_definition_line = node.lineno
@@ -2,17 +2,192 @@
 Development server with hot reload capabilities.
 """
 
+import functools
+import gzip
+import hashlib
 import http.server
 import os
-import socketserver
+import re
+import socket
+import stat
 import subprocess
+import sys
 import threading
-import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+# Run command per project type, as returned by ProjectRunner.get_run_command
+_RUN_COMMANDS = {
+    "django": "python manage.py runserver",
+    "flask": "python app.py",
+    "fastapi": "uvicorn main:app --reload",
+    "package": "python -m pip install -e .",
+    "python": "python main.py",
+    "node": "npm start",
+    "static": None,  # Will use built-in static server
+}
+
+# Directories to watch per project type, as returned by
+# ProjectRunner.get_watch_dirs
+_WATCH_DIRS = {
+    "django": (".", "templates", "static"),
+    "flask": (".", "templates", "static"),
+    "fastapi": (".", "templates", "static"),
+    "package": (".", "src"),
+    "python": (".",),
+    "node": (".", "src", "public"),
+    "static": (".",),
+}
+
+# Files that identify a project type, checked in priority order
+_PROJECT_MARKERS = (
+    ("manage.py", "django"),
+    ("app.py", "flask"),
+    ("main.py", "flask"),
+    ("pyproject.toml", "package"),
+    ("setup.py", "package"),
+    ("requirements.txt", "python"),
+    ("package.json", "node"),
+)
+
+# Changed files with these extensions never trigger a reload
+_IGNORED_EXTENSIONS = (".pyc", ".pyo", ".swp", ".tmp", ".log")
+
+# How DevServer can watch files: "native" uses the platform's change
+# notifications, "poll" rescans periodically, "auto" picks per directory
+_WATCH_MODES = ("auto", "native", "poll")
+
+# Escaped characters in /proc/self/mountinfo paths, e.g. "\\040" for a space
+_OCTAL_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
+
+# Filesystems on which change notifications are missing or unreliable
+_POLL_FS_TYPES = frozenset(
+    ("nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p", "virtiofs")
+)
+
+
+# Static files up to _STATIC_CACHE_MAX_FILE bytes are served from memory,
+# keeping at most _STATIC_CACHE_MAX_BYTES of them
+_STATIC_CACHE_MAX_FILE = 1024 * 1024
+_STATIC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Ignored directories large enough to be worth keeping out of the watches;
+# smaller ones such as __pycache__ stay inside a recursive watch and their
+# events are dropped by the reload handler instead
+_UNWATCHED_DIRS = frozenset(
+    (".git", ".hg", ".svn", "node_modules", ".venv", "venv", "env", ".tox")
+)
+
+# Native watchers use one inotify instance per watch, so a watch plan
+# needing more than this falls back to a single recursive watch
+_MAX_WATCHES_PER_DIR = 32
+
+
+class _DevHTTPServer(http.server.ThreadingHTTPServer):
+    """HTTP server that handles each connection in its own daemon thread."""
+
+    # ThreadingHTTPServer already sets allow_reuse_address and daemon_threads
+    request_queue_size = 128
+
+    def get_request(self):
+        request, client_address = super().get_request()
+        # Small responses (headers, 304s) go out without Nagle's delay
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
+
+class _StaticCache:
+    """Size-bounded LRU of prebuilt responses for small static files."""
+
+    def __init__(self, max_bytes: int = _STATIC_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stamp: tuple) -> Optional[Tuple[bytes, bytes, str]]:
+        """Return the cached response for path if the file is unchanged."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: str, stamp: tuple, response: Tuple[bytes, bytes, str]):
+        """Cache a response, evicting the least recently used ones if full."""
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1][1])
+            self._entries[path] = (stamp, response)
+            self._size += len(response[1])
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted[1])
+
+
+class _SendfileHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that hands file bodies to the kernel via sendfile.
+
+    Small files are also kept in the server's ``static_cache``, if it has
+    one, and served from memory for as long as their mtime and size match.
+    """
+
+    def do_GET(self):
+        cache = getattr(self.server, "static_cache", None)
+        if cache is None or self.path.partition("?")[0].endswith("/"):
+            return super().do_GET()
+
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().do_GET()
+        if not stat.S_ISREG(st.st_mode) or st.st_size > _STATIC_CACHE_MAX_FILE:
+            return super().do_GET()
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        response = cache.get(path, stamp)
+        if response is None:
+            try:
+                with open(path, "rb") as f:
+                    body = f.read()
+            except OSError:
+                return super().do_GET()
+            response = self._build_response(path, body, st.st_mtime)
+            cache.put(path, stamp, response)
+
+        headers, body, etag = response
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        _send_prebuilt(self, headers, body)
+
+    def _build_response(
+        self, path: str, body: bytes, mtime: float
+    ) -> Tuple[bytes, bytes, str]:
+        return _prebuilt_response(
+            body,
+            self.guess_type(path),
+            f"Last-Modified: {self.date_time_string(mtime)}",
+        )
+
+    def copyfile(self, source, outputfile):
+        try:
+            # socket.sendfile uses os.sendfile where it can and falls back to
+            # plain sends itself, e.g. for the in-memory directory listings
+            self.connection.sendfile(source)
+        except AttributeError:
+            super().copyfile(source, outputfile)
 
 
 class DevServer:
@@ -27,6 +202,8 @@ class DevServer:
         ignore_patterns: Optional[List[str]] = None,
         command: Optional[str] = None,
         static_dir: Optional[str] = None,
+        watch_mode: str = "auto",
+        poll_interval: float = 1.0,
     ):
         """
         Initialize development server.
@@ -39,7 +216,15 @@ class DevServer:
             ignore_patterns: Patterns to ignore
             command: Command to run (if not serving static files)
             static_dir: Directory to serve static files from
+            watch_mode: "native", "poll", or "auto" to poll only directories
+                on network filesystems
+            poll_interval: Seconds between scans for polled directories
         """
+        if watch_mode not in _WATCH_MODES:
+            raise ValueError(
+                f"Unknown watch mode '{watch_mode}'. Choose from: {list(_WATCH_MODES)}"
+            )
+
         self.port = port
         self.host = host
         self.hot_reload = hot_reload
@@ -53,12 +238,17 @@ class DevServer:
         ]
         self.command = command
         self.static_dir = static_dir
+        self.watch_mode = watch_mode
+        self.poll_interval = poll_interval
 
         self.server = None
         self.process = None
         self.observer = None
+        self.poll_observer = None
+        self._flat_watches = set()
         self.reload_callbacks = []
         self.is_running = False
+        self._stop_event = threading.Event()
 
     def add_reload_callback(self, callback: Callable) -> None:
         """Add a callback to be called on file changes."""
@@ -66,7 +256,7 @@ class DevServer:
 
     def start(self) -> None:
         """Start the development server."""
-        print(f"🚀 Starting development server on {self.host}:{self.port}")
+        print(f"Starting development server on {self.host}:{self.port}")
 
         if self.command:
             self._start_command_server()
@@ -79,24 +269,29 @@ class DevServer:
             self._start_file_watcher()
 
         self.is_running = True
-        print(f"✅ Server running at http://{self.host}:{self.port}")
+        self._stop_event.clear()
+        print(f"Server running at http://{self.host}:{self.port}")
 
+        # Keep the main thread blocked until stop(); Windows only delivers
+        # Ctrl+C between waits, so wake up periodically there
+        timeout = 1 if os.name == "nt" else None
         try:
-            # Keep the main thread alive
-            while self.is_running:
-                time.sleep(1)
+            while not self._stop_event.wait(timeout):
+                pass
         except KeyboardInterrupt:
             self.stop()
 
     def stop(self) -> None:
         """Stop the development server."""
-        print("\n🛑 Stopping development server...")
+        print("\nStopping development server...")
 
         self.is_running = False
+        self._stop_event.set()
 
-        if self.observer:
-            self.observer.stop()
-            self.observer.join()
+        for observer in (self.observer, self.poll_observer):
+            if observer:
+                observer.stop()
+                observer.join()
 
         if self.process:
             self.process.terminate()
@@ -105,40 +300,38 @@ class DevServer:
         if self.server:
             self.server.shutdown()
 
-        print("✅ Server stopped")
+        print("Server stopped")
 
     def _start_command_server(self) -> None:
         """Start server using a custom command."""
-
-        def run_command():
-            try:
-                self.process = subprocess.Popen(
-                    self.command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                )
-
-                # Read output in real-time
-                for line in iter(self.process.stdout.readline, ""):
-                    if line:
-                        print(f"[SERVER] {line.strip()}")
-
-            except Exception as e:
-                print(f"❌ Error running command: {e}")
-
-        thread = threading.Thread(target=run_command, daemon=True)
+        try:
+            self._spawn_command()
+        except Exception as e:
+            print(f"Error running command: {e}")
+
+    def _spawn_command(self) -> None:
+        """Run the server command and relay its output in the background."""
+        # stderr is merged into stdout so a chatty child cannot block on a
+        # pipe nobody reads; output is relayed in chunks, not line by line
+        self.process = subprocess.Popen(
+            self.command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        thread = threading.Thread(
+            target=_relay_output, args=(self.process.stdout,), daemon=True
+        )
         thread.start()
 
     def _start_static_server(self) -> None:
         """Start a static file server."""
-        os.chdir(self.static_dir)
-
-        handler = http.server.SimpleHTTPRequestHandler
+        handler = functools.partial(_SendfileHandler, directory=self.static_dir)
 
         def run_server():
-            with socketserver.TCPServer((self.host, self.port), handler) as httpd:
+            with _DevHTTPServer((self.host, self.port), handler) as httpd:
+                httpd.static_cache = _StaticCache()
                 self.server = httpd
                 httpd.serve_forever()
 
@@ -154,12 +347,160 @@ class DevServer:
 
             def do_GET(self):
                 if self.path == "/":
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
-                    self.end_headers()
+                    plain, gzipped = self.server.index_response
+                    accept = self.headers.get("Accept-Encoding", "")
+                    headers, body, etag = gzipped if _accepts_gzip(accept) else plain
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Vary", "Accept-Encoding")
+                        self.end_headers()
+                        return
+
+                    # The page never changes while the server runs, so it is
+                    # rendered once and sent with a single system call
+                    _send_prebuilt(self, headers, body)
+                else:
+                    super().do_GET()
+
+        def run_server():
+            with _DevHTTPServer((self.host, self.port), DevServerHandler) as httpd:
+                httpd.index_response = _build_index_response(
+                    httpd.server_port, self.hot_reload
+                )
+                self.server = httpd
+                httpd.serve_forever()
+
+        thread = threading.Thread(target=run_server, daemon=True)
+        thread.start()
+
+    def _start_file_watcher(self) -> None:
+        """Start watching files for changes."""
+        if not self.hot_reload:
+            return
+
+        class ReloadHandler(FileSystemEventHandler):
+            def __init__(self, dev_server):
+                self.dev_server = dev_server
+                self.reload_delay = 1  # seconds of quiet before reloading
+                self._ignore_re = _compile_ignore_patterns(dev_server.ignore_patterns)
+                self._lock = threading.Lock()
+                self._pending = {}
+                self._timer = None
+
+            def on_created(self, event):
+                # Subdirectories of a non-recursive watch need their own
+                if (
+                    event.is_directory
+                    and os.path.normpath(os.path.dirname(event.src_path))
+                    in self.dev_server._flat_watches
+                    and not self._should_ignore(event.src_path)
+                ):
+                    self.dev_server._schedule_watch(self, event.src_path, True)
+
+            def on_modified(self, event):
+                if event.is_directory:
+                    return
+
+                # Check if file should be ignored; paths stay plain strings
+                # until a batch is reported
+                path_str = event.src_path
+                if self._should_ignore(path_str):
+                    return
+
+                # Debounce: a burst of changes (e.g. a git checkout) is handled
+                # once, after it has been quiet for reload_delay seconds
+                with self._lock:
+                    self._pending[path_str] = None
+                    if self._timer is not None:
+                        self._timer.cancel()
+                    self._timer = threading.Timer(self.reload_delay, self._reload)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+            def _reload(self):
+                with self._lock:
+                    changed = list(self._pending)
+                    self._pending.clear()
+                    self._timer = None
+
+                if not changed or not self.dev_server.is_running:
+                    return
+
+                if len(changed) == 1:
+                    print(f"File changed: {changed[0]}")
+                else:
+                    print(f"{len(changed)} files changed")
+
+                # Call reload callbacks
+                for path_str in changed:
+                    file_path = Path(path_str)
+                    for callback in self.dev_server.reload_callbacks:
+                        try:
+                            callback(file_path)
+                        except Exception as e:
+                            print(f"Reload callback error: {e}")
 
-                    html = (
-                        """
+                # Restart command if running
+                if self.dev_server.command and self.dev_server.process:
+                    print("Restarting server...")
+                    self.dev_server.process.terminate()
+                    self.dev_server.process.wait()
+
+                    # Start new process
+                    try:
+                        self.dev_server._spawn_command()
+                        print("Server restarted")
+                    except Exception as e:
+                        print(f"Error restarting server: {e}")
+
+            def _should_ignore(self, path_str: str) -> bool:
+                """Check if file should be ignored."""
+                if path_str.endswith(_IGNORED_EXTENSIONS):
+                    return True
+                return self._ignore_re is not None and bool(
+                    self._ignore_re.search(path_str)
+                )
+
+        # One handler for all directories so changes across them are batched
+        handler = ReloadHandler(self)
+        for watch_dir in self.watch_dirs:
+            if os.path.exists(watch_dir):
+                targets = _watch_targets(watch_dir, handler._ignore_re)
+                for path, recursive in targets:
+                    self._schedule_watch(handler, path, recursive)
+                print(f"Watching {watch_dir} for changes ({len(targets)} watches)...")
+
+        for observer in (self.observer, self.poll_observer):
+            if observer:
+                observer.start()
+
+    def _schedule_watch(self, handler, path: str, recursive: bool) -> None:
+        """Watch a directory, remembering it if its subdirectories are not."""
+        if not recursive:
+            self._flat_watches.add(os.path.normpath(path))
+        self._get_observer(path).schedule(handler, path, recursive=recursive)
+
+    def _get_observer(self, watch_dir: str):
+        """Return the observer that should watch a directory, creating it."""
+        poll = self.watch_mode == "poll" or (
+            self.watch_mode == "auto" and _detect_fs_type(watch_dir) in _POLL_FS_TYPES
+        )
+
+        if poll:
+            if self.poll_observer is None:
+                self.poll_observer = PollingObserver(timeout=self.poll_interval)
+            return self.poll_observer
+
+        if self.observer is None:
+            self.observer = Observer()
+        return self.observer
+
+
+def _build_index_response(port: int, hot_reload: bool) -> tuple:
+    """Render the landing page once, as plain and gzip prebuilt responses."""
+    html = (
+        """
 <!DOCTYPE html>
 <html>
 <head>
@@ -177,42 +518,42 @@ class DevServer:
 <body>
     <div class="container">
         <h1>🚀 DevTools Helper Development Server</h1>
-        
+
         <div class="status">
             <strong>✅ Server Status:</strong> Running successfully<br>
             <strong>🌐 Address:</strong> http://localhost:"""
-                        + str(self.server.server_port)
-                        + """<br>
+        + str(port)
+        + """<br>
             <strong>🔄 Hot Reload:</strong> """
-                        + ("Enabled" if self.hot_reload else "Disabled")
-                        + """
+        + ("Enabled" if hot_reload else "Disabled")
+        + """
         </div>
-        
+
         <h2>🛠️ Available Features</h2>
-        
+
         <div class="feature">
             <h3>📁 Project Generator</h3>
             <p>Create new projects with predefined templates:</p>
             <code>devtools create-project my-project --template webapp</code>
         </div>
-        
+
         <div class="feature">
             <h3>🔍 Code Quality Checker</h3>
             <p>Analyze your code quality and get detailed reports:</p>
             <code>devtools check-quality ./src</code>
         </div>
-        
+
         <div class="feature">
             <h3>⚙️ Configuration Manager</h3>
             <p>Manage application configuration easily:</p>
             <code>devtools init-config --type web</code>
         </div>
-        
+
         <div class="feature">
             <h3>🔥 Hot Reload</h3>
             <p>This server automatically reloads when you change files in your project.</p>
         </div>
-        
+
         <h2>📚 Quick Start</h2>
         <p>To get started with DevTools Helper:</p>
         <ol>
@@ -221,15 +562,15 @@ class DevServer:
             <li>Check quality: <code>devtools check-quality ./my-app</code></li>
             <li>Start server: <code>devtools serve --hot-reload</code></li>
         </ol>
-        
+
         <div class="footer">
             <p>Powered by DevTools Helper | Press Ctrl+C to stop the server</p>
         </div>
     </div>
-    
+
     """
-                        + (
-                            """
+        + (
+            """
     <script>
         // Hot reload functionality
         if (window.location.hostname === 'localhost') {
@@ -242,106 +583,192 @@ class DevServer:
         }
     </script>
     """
-                            if self.hot_reload
-                            else ""
-                        )
-                        + """
+            if hot_reload
+            else ""
+        )
+        + """
 </body>
 </html>
                     """
-                    )
-
-                    self.wfile.write(html.encode())
-                else:
-                    super().do_GET()
-
-        def run_server():
-            with socketserver.TCPServer(
-                (self.host, self.port), DevServerHandler
-            ) as httpd:
-                self.server = httpd
-                httpd.serve_forever()
-
-        thread = threading.Thread(target=run_server, daemon=True)
-        thread.start()
-
-    def _start_file_watcher(self) -> None:
-        """Start watching files for changes."""
-        if not self.hot_reload:
-            return
-
-        class ReloadHandler(FileSystemEventHandler):
-            def __init__(self, dev_server):
-                self.dev_server = dev_server
-                self.last_reload = 0
-                self.reload_delay = 1  # seconds
-
-            def on_modified(self, event):
-                if event.is_directory:
-                    return
-
-                # Check if file should be ignored
-                file_path = Path(event.src_path)
-                if self._should_ignore(file_path):
-                    return
-
-                # Rate limit reloads
-                current_time = time.time()
-                if current_time - self.last_reload < self.reload_delay:
-                    return
-
-                self.last_reload = current_time
-                print(f"🔄 File changed: {file_path}")
-
-                # Call reload callbacks
-                for callback in self.dev_server.reload_callbacks:
-                    try:
-                        callback(file_path)
-                    except Exception as e:
-                        print(f"❌ Reload callback error: {e}")
-
-                # Restart command if running
-                if self.dev_server.command and self.dev_server.process:
-                    print("🔄 Restarting server...")
-                    self.dev_server.process.terminate()
-                    self.dev_server.process.wait()
+    )
+
+    body = html.encode("utf-8")
+    content_type = "text/html; charset=utf-8"
+    vary = "Vary: Accept-Encoding"
+    return (
+        _prebuilt_response(body, content_type, vary),
+        _prebuilt_response(
+            gzip.compress(body, compresslevel=6, mtime=0),
+            content_type,
+            "Content-Encoding: gzip",
+            vary,
+        ),
+    )
+
+
+def _prebuilt_response(
+    body: bytes, content_type: str, *extra_headers: str
+) -> Tuple[bytes, bytes, str]:
+    """Build the fixed headers of a 200 response for a fixed body.
+
+    The status line, Server and Date headers depend on the handler and the
+    time of the request, so _send_prebuilt adds them when sending.
+
+    Returns:
+        The encoded headers (ending with the blank line), the body, and its
+        ETag
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    lines = [
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"ETag: {etag}",
+        "Cache-Control: no-cache",
+        *extra_headers,
+        "",
+        "",
+    ]
+    return "\r\n".join(lines).encode("latin-1"), body, etag
+
+
+def _send_prebuilt(handler, headers: bytes, body: bytes) -> None:
+    """Log and send a prebuilt response, gathering head and body in one send."""
+    handler.log_request(200, len(body))
+    # Same status line, Server and Date headers as send_response(200)
+    head = (
+        f"{handler.protocol_version} 200 OK\r\n"
+        f"Server: {handler.version_string()}\r\n"
+        f"Date: {handler.date_time_string()}\r\n"
+    ).encode("latin-1", "strict") + headers
+    sock = handler.connection
+    if not hasattr(sock, "sendmsg"):  # e.g. on Windows
+        handler.wfile.write(head + body)
+        return
+
+    sent = sock.sendmsg([head, body])
+    if sent < len(head):
+        sock.sendall(head[sent:])
+        sent = len(head)
+    if sent - len(head) < len(body):
+        sock.sendall(memoryview(body)[sent - len(head) :])
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        if name.strip() != "gzip":
+            continue
+        params = params.replace(" ", "")
+        if not params.startswith("q="):
+            return True
+        try:
+            return float(params[2:]) > 0
+        except ValueError:
+            return False
+    return False
 
-                    # Start new process
-                    try:
-                        self.dev_server.process = subprocess.Popen(
-                            self.dev_server.command,
-                            shell=True,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                        )
-                        print("✅ Server restarted")
-                    except Exception as e:
-                        print(f"❌ Error restarting server: {e}")
 
-            def _should_ignore(self, file_path: Path) -> bool:
-                """Check if file should be ignored."""
-                path_str = str(file_path)
+def _watch_targets(root: str, ignore_re: Optional[re.Pattern]) -> list:
+    """Plan the watches for root that keep large ignored trees unwatched.
 
-                for pattern in self.dev_server.ignore_patterns:
-                    if pattern in path_str:
-                        return True
+    Directories with no ignored _UNWATCHED_DIRS tree below them get one
+    recursive watch; the directories above such a tree get a non-recursive
+    watch each. If that would take more than _MAX_WATCHES_PER_DIR watches,
+    root is watched recursively as a whole.
 
-                # Ignore certain file types
-                ignored_extensions = [".pyc", ".pyo", ".swp", ".tmp", ".log"]
-                if file_path.suffix in ignored_extensions:
-                    return True
+    Returns:
+        A list of (path, recursive) pairs
+    """
+    targets = []
 
-                return False
+    def visit(path: str) -> bool:
+        # True if nothing below path needs splitting out, so one recursive
+        # watch will do
+        try:
+            with os.scandir(path) as it:
+                subdirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return True
+
+        clean = []
+        split = False
+        for entry in subdirs:
+            if ignore_re is not None and ignore_re.search(entry.path):
+                split = split or entry.name in _UNWATCHED_DIRS
+            elif visit(entry.path):
+                clean.append(entry.path)
+            else:
+                split = True
+        if not split:
+            return True
+
+        targets.append((path, False))
+        targets.extend((subdir, True) for subdir in clean)
+        return False
+
+    if visit(root) or len(targets) > _MAX_WATCHES_PER_DIR:
+        return [(root, True)]
+    return targets
+
+
+def _relay_output(stream) -> None:
+    """Copy a child's output stream to our stdout until it closes."""
+    out = getattr(sys.stdout, "buffer", None)
+    with stream:
+        while True:
+            chunk = stream.read(65536)
+            if not chunk:
+                break
+            if out is not None:
+                out.write(chunk)
+                out.flush()
+            else:
+                sys.stdout.write(chunk.decode(errors="replace"))
+
+
+def _compile_ignore_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """Combine substring ignore patterns into one regex, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+@functools.lru_cache(maxsize=None)
+def _mount_table() -> tuple:
+    """Return (mount point, filesystem type) pairs, longest mount point first."""
+    mounts = []
+    try:
+        with open("/proc/self/mountinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                # Fields: id parent major:minor root mount-point options
+                # [optional fields...] - fs-type source super-options
+                fields, _, rest = line.partition(" - ")
+                parts = fields.split()
+                if len(parts) < 5 or not rest:
+                    continue
+                # Spaces, tabs, newlines and backslashes are octal-escaped
+                mount_point = _OCTAL_ESCAPE_RE.sub(
+                    lambda match: chr(int(match.group(1), 8)), parts[4]
+                )
+                mounts.append((mount_point, rest.split()[0]))
+    except OSError:
+        # Not Linux, or /proc is unavailable
+        pass
 
-        self.observer = Observer()
+    mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+    return tuple(mounts)
 
-        for watch_dir in self.watch_dirs:
-            if os.path.exists(watch_dir):
-                self.observer.schedule(ReloadHandler(self), watch_dir, recursive=True)
-                print(f"👀 Watching {watch_dir} for changes...")
 
-        self.observer.start()
+def _detect_fs_type(path: str) -> Optional[str]:
+    """Return the filesystem type that path lives on, if it can be determined."""
+    real_path = os.path.realpath(path)
+    for mount_point, fs_type in _mount_table():
+        if real_path == mount_point or real_path.startswith(
+            mount_point.rstrip("/") + "/"
+        ):
+            return fs_type
+    return None
 
 
 class LiveReloadServer:
@@ -368,50 +795,23 @@ class ProjectRunner:
     @staticmethod
     def detect_project_type(path: str = ".") -> str:
         """Detect the type of project in the given path."""
-        path_obj = Path(path)
-
-        # Check for specific files that indicate project type
-        if (path_obj / "manage.py").exists():
-            return "django"
-        elif (path_obj / "app.py").exists() or (path_obj / "main.py").exists():
-            return "flask"
-        elif (path_obj / "pyproject.toml").exists() or (path_obj / "setup.py").exists():
-            return "package"
-        elif (path_obj / "requirements.txt").exists():
-            return "python"
-        elif (path_obj / "package.json").exists():
-            return "node"
-        else:
+        try:
+            with os.scandir(path) as it:
+                names = {entry.name for entry in it}
+        except OSError:
             return "static"
 
+        for marker, project_type in _PROJECT_MARKERS:
+            if marker in names:
+                return project_type
+        return "static"
+
     @staticmethod
     def get_run_command(project_type: str, path: str = ".") -> Optional[str]:
         """Get the appropriate run command for a project type."""
-        commands = {
-            "django": "python manage.py runserver",
-            "flask": "python app.py",
-            "fastapi": "uvicorn main:app --reload",
-            "package": "python -m pip install -e .",
-            "python": "python main.py",
-            "node": "npm start",
-            "static": None,  # Will use built-in static server
-        }
-
-        return commands.get(project_type)
+        return _RUN_COMMANDS.get(project_type)
 
     @staticmethod
     def get_watch_dirs(project_type: str, path: str = ".") -> List[str]:
         """Get directories to watch for different project types."""
-        [path]
-
-        project_dirs = {
-            "django": [".", "templates", "static"],
-            "flask": [".", "templates", "static"],
-            "fastapi": [".", "templates", "static"],
-            "package": [".", "src"],
-            "python": ["."],
-            "node": [".", "src", "public"],
-            "static": ["."],
-        }
-
-        return project_dirs.get(project_type, ["."])
+        return list(_WATCH_DIRS.get(project_type, (".",)))
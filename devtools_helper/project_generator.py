@@ -2,8 +2,12 @@
 Project structure generator for creating well-structured Python projects.
 """
 
+import os
 from pathlib import Path
 
+# Generated files are written unbuffered as UTF-8 with "\n" line endings
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 class ProjectGenerator:
     """Generates project structures from templates."""
@@ -50,7 +54,7 @@ class ProjectGenerator:
         elif template == "package":
             self._create_package_project(project_path, name)
 
-        print(f"✅ Project '{name}' created successfully at {project_path}")
+        print(f"Project '{name}' created successfully at {project_path}")
         return True
 
     def _create_basic_project(self, project_path: Path, name: str):
@@ -240,8 +244,13 @@ scikit-learn>=1.2.0"""
 
     def _create_file(self, path: Path, content: str):
         """Create a file with given content."""
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        fd = os.open(path, _CREATE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
 
     def _get_readme_template(self, name: str, project_type: str = "basic") -> str:
         """Get README template for project type."""
@@ -8,7 +8,7 @@ This script demonstrates the CodeChecker capabilities:
 - Understanding code maintainability
 """
 
-import tempfile
+from collections import Counter
 from pathlib import Path
 from devtools_helper import CodeChecker
 
@@ -19,15 +19,11 @@ def demonstrate_code_checker() -> None:
     print("🔍 DevTools Helper - Code Quality Checker Demo")
     print("=" * 55)
 
-    # Create a temporary directory with sample code
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # Sample sources are analyzed straight from memory; nothing touches disk
+    print("\n1️⃣ Preparing sample sources in memory...")
 
-        # Create sample Python files
-        print("\n1️⃣ Creating sample code files...")
-
-        # Good quality code
-        good_code = '''
+    # Good quality code
+    good_code = '''
 """
 A well-documented module with good practices.
 """
@@ -93,11 +89,10 @@ class DataProcessor:
         self.processed = True
 '''
 
-        (temp_path / "good_module.py").write_text(good_code)
-        print("   ✓ Created good_module.py (well-documented)")
+    print("   ✓ Prepared good_module.py in memory (well-documented)")
 
-        # Code with some issues
-        needs_work = '''
+    # Code with some issues
+    needs_work = '''
 # No module docstring
 
 def process(x):
@@ -135,54 +130,52 @@ class Handler:
             return data
 '''
 
-        (temp_path / "needs_improvement.py").write_text(needs_work)
-        print("   ✓ Created needs_improvement.py (has issues)")
-
-        # 2. Run analysis
-        print("\n2️⃣ Analyzing code quality...")
-        checker = CodeChecker()
-        report = checker.analyze(str(temp_path))
-
-        # 3. Display metrics
-        print("\n3️⃣ Code Metrics:")
-        metrics = report.get("metrics", {})
-
-        print(f"   📊 Total files: {metrics.get('total_files', 0)}")
-        print(f"   📝 Total lines: {metrics.get('total_lines', 0)}")
-        print(f"   🔧 Functions: {metrics.get('total_functions', 0)}")
-        print(f"   📦 Classes: {metrics.get('total_classes', 0)}")
-        print(f"   📏 Avg function length: {metrics.get('avg_function_length', 0):.1f} lines")
-        print(f"   📚 Docstring coverage: {metrics.get('docstring_coverage', 0):.1f}%")
-        print(f"   ⭐ Maintainability: {metrics.get('maintainability_score', 0)}/100")
-
-        # 4. Display issues
-        print("\n4️⃣ Issues Found:")
-        issues = report.get("issues", [])
-
-        if not issues:
-            print("   ✓ No issues found!")
-        else:
-            issue_types = {}
-            for issue in issues:
-                issue_type = issue.get("type", "unknown")
-                issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-
-            for issue_type, count in sorted(issue_types.items()):
-                print(f"   • {issue_type}: {count} occurrence(s)")
-
-            # Show first few issues
-            print("\n   First 3 issues:")
-            for issue in issues[:3]:
-                print(f"   └─ [{issue.get('type')}] {issue.get('message', 'No message')}")
-                if issue.get("file"):
-                    print(f"      in {Path(issue['file']).name}:{issue.get('line', '?')}")
-
-        # 5. Summary
-        print("\n5️⃣ Summary:")
-        summary = report.get("summary", {})
-        print(f"   Total issues: {summary.get('total_issues', 0)}")
-        print(f"   Warnings: {summary.get('warnings', 0)}")
-        print(f"   Errors: {summary.get('errors', 0)}")
+    print("   ✓ Prepared needs_improvement.py in memory (has issues)")
+
+    # 2. Run analysis
+    print("\n2️⃣ Analyzing code quality...")
+    checker = CodeChecker()
+    report = checker.analyze_sources(
+        {"good_module.py": good_code, "needs_improvement.py": needs_work}
+    )
+
+    # 3. Display metrics
+    print("\n3️⃣ Code Metrics:")
+    metrics = report.get("metrics", {})
+
+    print(f"   📊 Total files: {metrics.get('total_files', 0)}")
+    print(f"   📝 Total lines: {metrics.get('total_lines', 0)}")
+    print(f"   🔧 Functions: {metrics.get('total_functions', 0)}")
+    print(f"   📦 Classes: {metrics.get('total_classes', 0)}")
+    print(f"   📏 Avg function length: {metrics.get('avg_function_length', 0):.1f} lines")
+    print(f"   📚 Docstring coverage: {metrics.get('docstring_coverage', 0):.1f}%")
+    print(f"   ⭐ Maintainability: {metrics.get('maintainability_score', 0)}/100")
+
+    # 4. Display issues
+    print("\n4️⃣ Issues Found:")
+    issues = report.get("issues", [])
+
+    if not issues:
+        print("   ✓ No issues found!")
+    else:
+        issue_types = Counter(issue.get("type", "unknown") for issue in issues)
+
+        for issue_type, count in sorted(issue_types.items()):
+            print(f"   • {issue_type}: {count} occurrence(s)")
+
+        # Show first few issues
+        print("\n   First 3 issues:")
+        for issue in issues[:3]:
+            print(f"   └─ [{issue.get('type')}] {issue.get('message', 'No message')}")
+            if issue.get("file"):
+                print(f"      in {Path(issue['file']).name}:{issue.get('line', '?')}")
+
+    # 5. Summary
+    print("\n5️⃣ Summary:")
+    summary = report.get("summary", {})
+    print(f"   Total issues: {summary.get('total_issues', 0)}")
+    print(f"   Warnings: {summary.get('warnings', 0)}")
+    print(f"   Errors: {summary.get('errors', 0)}")
 
     # Summary
     print("\n" + "=" * 55)
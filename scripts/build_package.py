@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Simple build script for DevTools Helper package."""
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -10,7 +11,6 @@ def run_command(command):
     try:
         result = subprocess.run(
             command, 
-            shell=True, 
             check=True, 
             capture_output=True, 
             text=True,
@@ -37,17 +37,21 @@ def main():
         import build
     except ImportError:
         print("Installing build dependencies...")
-        success, _ = run_command("pip install build")
+        success, _ = run_command([sys.executable, "-m", "pip", "install", "build"])
         if not success:
             print("ERROR: Failed to install build dependencies.")
             sys.exit(1)
     
-    for dir_name in ["dist", "build", "*.egg-info"]:
-        if Path(dir_name).exists():
-            print(f"Cleaning {dir_name}...")
+    # One directory listing covers dist, build and any *.egg-info
+    with os.scandir(".") as entries:
+        names = {entry.name for entry in entries}
+    old_builds = [name for name in ("dist", "build") if name in names]
+    old_builds += sorted(name for name in names if name.endswith(".egg-info"))
+    for dir_name in old_builds:
+        print(f"Cleaning {dir_name}...")
     
     print("Building package...")
-    success, output = run_command("python -m build")
+    success, output = run_command([sys.executable, "-m", "build"])
     
     if success:
         print("SUCCESS: Package built successfully!")
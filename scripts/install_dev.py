@@ -18,10 +18,14 @@ def run_command(command, description, check=True):
     """Run a command with nice output."""
     print(f"🔄 {description}...")
     try:
-        if isinstance(command, str):
-            result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
-        else:
-            result = subprocess.run(command, check=check, capture_output=True, text=True)
+        # Only stderr is ever shown, so don't hold pip's whole stdout log in memory
+        result = subprocess.run(
+            command,
+            check=check,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
         
         if result.returncode == 0:
             print(f"✅ {description} - Success!")
@@ -102,7 +106,7 @@ def main():
     else:
         print("   1. Activate environment: source venv/bin/activate")
     
-    print("   2. Test CLI: python -m devtools_helper.cli --help")
+    print("   2. Test CLI: python -m devtools_helper --help")
     print("   3. Run tests: python -m pytest tests/")
     print("   4. Start coding! 🚀")
     
@@ -110,7 +114,7 @@ def main():
     print("\n🛠️  Available Commands:")
     print("   python scripts/build_package.py - Build package")
     print("   python -m pytest tests/   - Run tests")
-    print("   python -m devtools_helper.cli --help - CLI help")
+    print("   python -m devtools_helper --help - CLI help")
     
     if os_name != "Windows":
         print("   make help                 - Show Makefile commands")
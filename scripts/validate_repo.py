@@ -3,9 +3,8 @@
 Quick validation script for GitHub users.
 Run this after cloning to ensure everything works.
 """
-import subprocess
+import os
 import sys
-from pathlib import Path
 
 # Enable UTF-8 output on Windows
 if sys.platform == "win32":
@@ -17,8 +16,8 @@ def main():
     print("====================================")
     
     # Check if we're in the right place
-    required_files = ["pyproject.toml", "setup.py", "devtools_helper", "scripts/install_dev.py"]
-    missing_files = [f for f in required_files if not Path(f).exists()]
+    required_files = ["pyproject.toml", "devtools_helper", "scripts/install_dev.py"]
+    missing_files = [f for f in required_files if not os.path.exists(f)]
     
     if missing_files:
         print(f"❌ Missing files: {', '.join(missing_files)}")
@@ -56,7 +56,7 @@ def test_core_modules():
 
 def test_dependencies():
     """Test if required dependencies are available."""
-    deps = ['click', 'watchdog', 'yaml', 'flask', 'jinja2']
+    deps = ['click', 'watchdog', 'yaml', 'flask']
     all_passed = True
     
     for dep in deps:
@@ -95,8 +95,8 @@ def main():
     if all(results):
         print("🎉 All tests passed! Installation is working correctly.")
         print("\n🚀 Try these commands:")
-        print("   python -m devtools_helper.cli --help")
-        print("   python -m devtools_helper.cli templates")
+        print("   python -m devtools_helper --help")
+        print("   python -m devtools_helper templates")
     else:
         print("❌ Some tests failed. Check the output above.")
         sys.exit(1)
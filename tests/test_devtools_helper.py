@@ -3,6 +3,8 @@ Tests for DevTools Helper package.
 """
 
 import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -109,6 +111,168 @@ class TestClass:
         assert report["summary"]["errors"] > 0
         assert any(issue["type"] == "syntax_error" for issue in report["issues"])
 
+    def test_analyze_plain_file_has_no_parse_errors(self):
+        """Test that valid code is never reported as a parse failure."""
+        test_file = Path(self.temp_dir) / "plain.py"
+        test_file.write_text(
+            '"""Doc."""\n\n\ndef plain(value):\n    """Doc."""\n'
+            "    if value:\n        return [v for v in value]\n"
+            "    try:\n        return value\n    except ValueError:\n"
+            "        return None\n"
+        )
+
+        report = self.checker.analyze(str(test_file))
+
+        assert report["metrics"]["total_files"] == 1
+        assert not [i for i in report["issues"] if i["type"] == "syntax_error"]
+
+    def test_analyze_reports_style_issues(self):
+        """Test naming, docstring and import placement checks."""
+        test_file = Path(self.temp_dir) / "style.py"
+        test_file.write_text(
+            "VALUE = 1\nimport os\n\n\ndef BadName():\n    return os.sep\n"
+        )
+
+        report = self.checker.analyze(str(test_file))
+        issue_types = {issue["type"] for issue in report["issues"]}
+
+        assert "import_not_at_top" in issue_types
+        assert "naming_convention" in issue_types
+        assert "missing_docstring" in issue_types
+
+    def test_line_length_counts_characters(self):
+        """Test that line length is measured in characters, not bytes."""
+        test_file = Path(self.temp_dir) / "unicode.py"
+        test_file.write_text(
+            f'"""Doc."""\n\nNAME = "{"é" * 70}"\nOTHER = "{"x" * 90}"\n',
+            encoding="utf-8",
+        )
+
+        report = self.checker.analyze(str(test_file))
+        long_lines = [
+            issue["line"]
+            for issue in report["issues"]
+            if issue["type"] == "line_too_long"
+        ]
+
+        assert long_lines == [4]
+        assert report["metrics"]["total_lines"] == 4
+
+    def test_analyze_directory_skips_environments(self):
+        """Test that only whole skipped directory names are excluded."""
+        root = Path(self.temp_dir)
+        (root / "venv").mkdir()
+        (root / "venv" / "vendored.py").write_text("x = 1\n")
+        (root / "environment.py").write_text("x = 1\n")
+
+        report = self.checker.analyze(str(root))
+
+        assert report["metrics"]["total_files"] == 1
+
+    def test_min_severity_filters_issues(self):
+        """Test that lower severities are dropped but still scored."""
+        test_file = Path(self.temp_dir) / "filtered.py"
+        test_file.write_text("def BadName(a, b, c, d, e, f):\n    pass\n")
+
+        full = CodeChecker().analyze(str(test_file))
+        filtered = CodeChecker(min_severity="warning").analyze(str(test_file))
+
+        assert {issue["severity"] for issue in full["issues"]} == {"info", "warning"}
+        assert [issue["type"] for issue in filtered["issues"]] == [
+            "too_many_parameters"
+        ]
+        assert (
+            filtered["metrics"]["documentation_score"]
+            == full["metrics"]["documentation_score"]
+        )
+
+        with pytest.raises(ValueError):
+            CodeChecker(min_severity="fatal")
+
+    def test_analyze_with_cache(self):
+        """Test that cached results match and changed files are re-analyzed."""
+        test_file = Path(self.temp_dir) / "cached.py"
+        test_file.write_text("def BadName():\n    pass\n")
+        cache_path = Path(self.temp_dir) / "cache" / "analysis.pickle"
+
+        first = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+        assert cache_path.exists()
+
+        second = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+        assert second["issues"] == first["issues"]
+        assert second["metrics"] == first["metrics"]
+
+        test_file.write_text('"""Doc."""\n\n\ndef good_name():\n    """Doc."""\n')
+        third = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+        assert third["issues"] == []
+
+    def test_no_digests_without_cache(self, monkeypatch):
+        """Test that sources are only hashed when a cache is in use."""
+        import types
+
+        from devtools_helper import code_checker
+
+        test_file = Path(self.temp_dir) / "plain.py"
+        test_file.write_text("def BadName():\n    pass\n")
+        monkeypatch.setattr(code_checker, "hashlib", types.SimpleNamespace())
+
+        report = CodeChecker().analyze(str(test_file))
+        assert report["metrics"]["total_files"] == 1
+
+    def test_cached_issues_are_not_shared_with_reports(self):
+        """Test that editing a report does not change cached results."""
+        test_file = Path(self.temp_dir) / "shared.py"
+        test_file.write_text("def BadName():\n    pass\n")
+        cache_path = Path(self.temp_dir) / "analysis.pickle"
+        checker = CodeChecker(cache_path=str(cache_path))
+
+        first = checker.analyze(str(test_file))
+        original = [dict(issue) for issue in first["issues"]]
+        first["issues"][0]["message"] = "edited"
+
+        second = checker.analyze(str(test_file))
+        assert second["issues"] == original
+        second["issues"][0]["message"] = "edited again"
+
+        assert checker.analyze(str(test_file))["issues"] == original
+        fresh = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+        assert fresh["issues"] == original
+
+    def test_cache_survives_touched_files(self, monkeypatch):
+        """Test that a file with a new mtime but the same content is reused."""
+        import os
+
+        from devtools_helper import code_checker
+
+        test_file = Path(self.temp_dir) / "touched.py"
+        test_file.write_text("def BadName():\n    pass\n")
+        cache_path = Path(self.temp_dir) / "analysis.pickle"
+        first = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged file was analyzed again")
+
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        monkeypatch.setattr(code_checker, "_analyze_file_worker", fail)
+        second = CodeChecker(cache_path=str(cache_path)).analyze(str(test_file))
+        assert second["issues"] == first["issues"]
+
+    def test_analyze_sources_matches_files(self):
+        """Test that in-memory sources are analyzed like files on disk."""
+        source = "def BadName():\n    x = '" + "a" * 90 + "'\n"
+        test_file = Path(self.temp_dir) / "module.py"
+        test_file.write_text(source)
+
+        from_disk = self.checker.analyze(str(test_file))
+        from_memory = CodeChecker().analyze_sources({str(test_file): source})
+
+        assert from_memory["issues"] == from_disk["issues"]
+        assert from_memory["metrics"] == from_disk["metrics"]
+
+        broken = CodeChecker().analyze_sources({"broken.py": "def broken(:\n"})
+        assert broken["summary"]["errors"] == 1
+
     def test_analyze_nonexistent_path(self):
         """Test analyzing nonexistent path."""
         with pytest.raises(FileNotFoundError):
@@ -143,6 +307,52 @@ class TestConfigManager:
         assert config2.get("app.name") == "Test App"
         assert config2.get("database.host") == "localhost"
 
+    def test_yaml_round_trip_uses_safe_types(self):
+        """Test that saved YAML can always be read back with the safe loader."""
+        config = ConfigManager()
+        config.set("app.ports", (80, 443))
+        config.save(str(self.config_file))
+
+        assert "!!python" not in self.config_file.read_text()
+        assert ConfigManager(str(self.config_file)).get("app.ports") == [80, 443]
+
+    def test_load_toml_config(self):
+        """Test loading a TOML configuration file."""
+        toml_file = Path(self.temp_dir) / "config.toml"
+        toml_file.write_text('[app]\nname = "Toml App"\nport = 8080\n')
+
+        config = ConfigManager(str(toml_file))
+
+        assert config.format == "toml"
+        assert config.get("app.name") == "Toml App"
+        assert config.get("app.port") == 8080
+
+    def test_load_returns_fresh_data(self):
+        """Test that repeated loads are independent and see file changes."""
+        self.config_file.write_text("app:\n  name: First\n")
+
+        first = ConfigManager(str(self.config_file))
+        first.set("app.name", "Edited")
+        second = ConfigManager(str(self.config_file))
+        assert second.get("app.name") == "First"
+
+        self.config_file.write_text("app:\n  name: Second one\n")
+        assert ConfigManager(str(self.config_file)).get("app.name") == "Second one"
+
+    def test_json_round_trip_keeps_non_finite_floats(self):
+        """Test that saving JSON keeps NaN and Infinity values."""
+        import math
+
+        json_file = Path(self.temp_dir) / "config.json"
+        config = ConfigManager()
+        config.set("limits.max", float("inf"))
+        config.set("limits.ratios", [1.5, float("nan")])
+        config.save(str(json_file))
+
+        loaded = ConfigManager(str(json_file))
+        assert loaded.get("limits.max") == float("inf")
+        assert math.isnan(loaded.get("limits.ratios")[1])
+
     def test_get_with_default(self):
         """Test getting values with defaults."""
         config = ConfigManager()
@@ -172,6 +382,38 @@ class TestConfigManager:
         assert "server" in web_template
         assert "database" in web_template
 
+    def test_template_is_independent_of_config(self):
+        """Test that editing the config does not change the returned template."""
+        config = ConfigManager()
+        template = config.create_template("web")
+
+        config.set("server.port", 9000)
+
+        assert template["server"]["port"] == 8000
+        assert config.create_template("web")["server"]["port"] == 8000
+
+    def test_validate_schema(self):
+        """Test schema validation of types and nested objects."""
+        config = ConfigManager()
+        config.update({"app.name": "App", "app.port": True, "app.tags": "x"})
+
+        errors = config.validate_schema(
+            {
+                "app": {
+                    "name": {"type": "string"},
+                    "port": {"type": "integer"},
+                    "tags": {"type": "array"},
+                },
+                "database": {"url": {"type": "string"}},
+            }
+        )
+
+        assert errors == [
+            "Field app.port should be integer, got bool",
+            "Field app.tags should be array, got str",
+            "Missing required field: database",
+        ]
+
     def test_load_from_env(self):
         """Test loading from environment variables."""
         import os
@@ -200,6 +442,318 @@ class TestConfigManager:
         del os.environ["TEST_APP_DEBUG"]
         del os.environ["TEST_DB_PORT"]
 
+    def test_load_from_mapping(self):
+        """Test loading environment-style values without touching os.environ."""
+        config = ConfigManager()
+        config.load_from_mapping(
+            {"APP_DB_PORT": "5432", "APP_DEBUG": "off", "OTHER": "x"}, "APP_"
+        )
+
+        assert config.get("db.port") == 5432
+        assert config.get("debug") is False
+        assert not config.has("other")
+
+    def test_convert_env_value(self):
+        """Test type detection for environment variable values."""
+        config = ConfigManager()
+
+        assert config._convert_env_value("Off") is False
+        assert config._convert_env_value("-12") == -12
+        assert config._convert_env_value("0.25") == 0.25
+        assert config._convert_env_value("1e3") == 1000.0
+        assert config._convert_env_value("/usr/bin") == "/usr/bin"
+        assert config._convert_env_value("v1.2") == "v1.2"
+
+
+class TestDevServer:
+    """Test development server configuration."""
+
+    def test_watch_mode(self):
+        """Test watch mode validation and observer selection."""
+        from devtools_helper import DevServer
+
+        server = DevServer(watch_mode="poll")
+        assert type(server._get_observer(".")).__name__ == "PollingObserver"
+
+        with pytest.raises(ValueError):
+            DevServer(watch_mode="inotify")
+
+    def test_reload_is_debounced(self, tmp_path, monkeypatch):
+        """Test that a burst of changes is reported once it settles."""
+        from watchdog.events import FileModifiedEvent
+
+        from devtools_helper import DevServer, dev_server
+
+        timers = []
+
+        class FakeTimer:
+            """Timer that only fires when the test says so."""
+
+            def __init__(self, interval, function):
+                self.function = function
+                self.cancelled = False
+                timers.append(self)
+
+            def start(self):
+                pass
+
+            def cancel(self):
+                self.cancelled = True
+
+        handlers = []
+        monkeypatch.setattr(dev_server.threading, "Timer", FakeTimer)
+        monkeypatch.setattr(
+            DevServer,
+            "_schedule_watch",
+            lambda self, handler, path, recursive: handlers.append(handler),
+        )
+
+        changed = []
+        server = DevServer(watch_dirs=[str(tmp_path)], ignore_patterns=[])
+        server.add_reload_callback(lambda path: changed.append(path.name))
+        server.is_running = True
+        server._start_file_watcher()
+        handler = handlers[0]
+
+        handler.on_modified(FileModifiedEvent("a.py"))
+        handler.on_modified(FileModifiedEvent("b.py"))
+        handler.on_modified(FileModifiedEvent("a.py"))
+
+        # Each change restarts the quiet period; nothing is reported yet
+        assert [timer.cancelled for timer in timers] == [True, True, False]
+        assert changed == []
+
+        timers[-1].function()
+        assert changed == ["a.py", "b.py"]
+
+    def test_stop_unblocks_start(self):
+        """Test that stop() wakes a blocked start() straight away."""
+        import threading
+        import time
+
+        from devtools_helper import DevServer
+
+        server = DevServer(port=0, hot_reload=False)
+        thread = threading.Thread(target=server.start, daemon=True)
+        thread.start()
+        while not server.is_running or server.server is None:
+            time.sleep(0.01)
+
+        server.stop()
+        thread.join(timeout=0.5)
+        assert not thread.is_alive()
+
+    def test_detect_project_type(self, tmp_path):
+        """Test project type detection from marker files."""
+        from devtools_helper.dev_server import ProjectRunner
+
+        assert ProjectRunner.detect_project_type(str(tmp_path)) == "static"
+        (tmp_path / "setup.py").write_text("")
+        assert ProjectRunner.detect_project_type(str(tmp_path)) == "package"
+        (tmp_path / "main.py").write_text("")
+        assert ProjectRunner.detect_project_type(str(tmp_path)) == "flask"
+        assert ProjectRunner.detect_project_type(str(tmp_path / "missing")) == "static"
+
+    def test_compile_ignore_patterns(self):
+        """Test that ignore patterns match as plain substrings."""
+        from devtools_helper.dev_server import _compile_ignore_patterns
+
+        ignore_re = _compile_ignore_patterns(["node_modules", "*.pyc"])
+
+        assert ignore_re.search("/app/node_modules/x.js")
+        assert ignore_re.search("/app/*.pyc")
+        assert not ignore_re.search("/app/main.pyc")
+        assert _compile_ignore_patterns([]) is None
+
+    def test_watch_targets_skip_ignored_dirs(self, tmp_path):
+        """Test that ignored directories are left out of the watch plan."""
+        import os
+
+        from devtools_helper.dev_server import _compile_ignore_patterns, _watch_targets
+
+        for sub in ("src/app", "node_modules/lib", "pkg/node_modules", "pkg/lib"):
+            (tmp_path / sub).mkdir(parents=True)
+        ignore_re = _compile_ignore_patterns(["node_modules"])
+
+        targets = _watch_targets(str(tmp_path), ignore_re)
+
+        assert sorted(
+            (os.path.relpath(path, tmp_path), recursive) for path, recursive in targets
+        ) == [(".", False), ("pkg", False), ("pkg/lib", True), ("src", True)]
+        assert _watch_targets(str(tmp_path / "src"), ignore_re) == [
+            (str(tmp_path / "src"), True)
+        ]
+
+    def test_watch_targets_stay_few_with_many_ignored_dirs(self, tmp_path):
+        """Test that __pycache__ everywhere still needs only one watch."""
+        from devtools_helper import DevServer
+        from devtools_helper.dev_server import _compile_ignore_patterns, _watch_targets
+
+        for index in range(150):
+            (tmp_path / f"pkg{index}" / "__pycache__").mkdir(parents=True)
+        ignore_re = _compile_ignore_patterns(DevServer().ignore_patterns)
+
+        assert _watch_targets(str(tmp_path), ignore_re) == [(str(tmp_path), True)]
+
+        # Too many large ignored trees fall back to one recursive watch too
+        for index in range(150):
+            (tmp_path / f"pkg{index}" / "node_modules").mkdir()
+        assert _watch_targets(str(tmp_path), ignore_re) == [(str(tmp_path), True)]
+
+    def test_static_cache(self):
+        """Test stat validation and size-bounded eviction of the static cache."""
+        from devtools_helper.dev_server import _StaticCache
+
+        cache = _StaticCache(max_bytes=10)
+        cache.put("a", (1, 6), (b"", b"aaaaaa", '"a"'))
+        assert cache.get("a", (1, 6)) == (b"", b"aaaaaa", '"a"')
+        assert cache.get("a", (2, 6)) is None
+
+        cache.put("b", (1, 6), (b"", b"bbbbbb", '"b"'))
+        assert cache.get("a", (1, 6)) is None
+        assert cache.get("b", (1, 6)) is not None
+
+    def test_index_response(self):
+        """Test the prebuilt landing page responses."""
+        import gzip
+
+        from devtools_helper.dev_server import _accepts_gzip, _build_index_response
+
+        plain, gzipped = _build_index_response(8123, False)
+        headers, body, etag = plain
+
+        assert b"http://localhost:8123" in body
+        assert b"EventSource" not in body
+        assert b"charset=utf-8" in headers
+        assert f"Content-Length: {len(body)}".encode() in headers
+        assert etag.encode() in headers
+        assert _build_index_response(8123, True)[0][2] != etag
+
+        assert gzip.decompress(gzipped[1]) == body
+        assert b"Content-Encoding: gzip" in gzipped[0]
+        assert gzipped[2] != etag
+
+        assert _accepts_gzip("gzip, deflate, br")
+        assert not _accepts_gzip("deflate, gzip;q=0")
+        assert not _accepts_gzip("")
+
+    def test_prebuilt_responses_match_normal_path(self, tmp_path):
+        """Test that cached static files get the same head as other responses."""
+        import http.client
+        import time
+
+        from devtools_helper import DevServer
+
+        (tmp_path / "page.txt").write_text("hello")
+        server = DevServer(port=0, hot_reload=False, static_dir=str(tmp_path))
+        server._start_static_server()
+        while server.server is None:
+            time.sleep(0.01)
+
+        def fetch(path):
+            conn = http.client.HTTPConnection("localhost", server.server.server_port)
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                return response
+            finally:
+                conn.close()
+
+        try:
+            # The listing goes through send_response, the file is prebuilt
+            listing, cached = fetch("/"), fetch("/page.txt")
+        finally:
+            server.server.shutdown()
+            server.server.server_close()
+
+        assert cached.status == listing.status == 200
+        assert cached.version == listing.version
+        assert cached.getheader("Server") == listing.getheader("Server")
+        assert cached.getheader("Date")
+        assert cached.getheader("Content-Length") == "5"
+
+
+class TestCLI:
+    """Test command-line interface."""
+
+    def test_template_choices_match_generator(self):
+        """Test that the CLI's template list matches the generator's."""
+        from devtools_helper import cli
+
+        assert list(cli._TEMPLATE_CHOICES) == ProjectGenerator().list_templates()
+        assert set(cli._TEMPLATE_DESCRIPTIONS) == set(cli._TEMPLATE_CHOICES)
+
+    def test_templates_command(self):
+        """Test listing templates."""
+        from click.testing import CliRunner
+
+        from devtools_helper.cli import cli
+
+        result = CliRunner().invoke(cli, ["templates"])
+
+        assert result.exit_code == 0
+        for template in ProjectGenerator().list_templates():
+            assert template in result.output
+
+    def test_version_flags(self):
+        """Test that -V and --version work on the group itself."""
+        from click.testing import CliRunner
+
+        from devtools_helper import __version__
+        from devtools_helper.cli import cli
+
+        for flag in ("--version", "-V"):
+            result = CliRunner().invoke(cli, [flag])
+            assert result.exit_code == 0
+            assert result.output == f"devtools, version {__version__}\n"
+
+    def test_init_config_cache_is_keyed_on_code(self, tmp_path, monkeypatch):
+        """Test that cached init-config templates follow the installed code."""
+        from click.testing import CliRunner
+
+        from devtools_helper import cli
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        output = tmp_path / "config.yaml"
+
+        result = CliRunner().invoke(cli.cli, ["init-config", "-o", str(output)])
+        assert result.exit_code == 0
+        cached = Path(cli._template_cache_file("basic", "yaml"))
+        assert cached.read_text() == output.read_text()
+        assert [p.name for p in cached.parent.iterdir()] == [cached.name]
+        assert cli.__version__ in cached.parent.name
+
+        # A different release must not reuse the old template, however old
+        # its files' mtimes are
+        cli._template_cache_key.cache_clear()
+        monkeypatch.setattr(cli, "__version__", "0.0.0-other")
+        assert not Path(cli._template_cache_file("basic", "yaml")).exists()
+        cli._template_cache_key.cache_clear()
+
+
+class TestPackage:
+    """Test package-level behaviour."""
+
+    def test_lazy_imports(self):
+        """Test that importing the package does not load the backends."""
+        code = (
+            "import sys, devtools_helper; "
+            "assert 'devtools_helper.dev_server' not in sys.modules; "
+            "assert devtools_helper.DevServer.__name__ == 'DevServer'; "
+            "assert 'devtools_helper.dev_server' in sys.modules"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        import devtools_helper
+
+        with pytest.raises(AttributeError):
+            devtools_helper.NotAThing
+
 
 if __name__ == "__main__":
     pytest.main([__file__])